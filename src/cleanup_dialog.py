@@ -1,59 +1,75 @@
-from PySide6.QtWidgets import (
-    QDialog,
-    QVBoxLayout,
-    QLabel,
-    QCheckBox,
-    QDialogButtonBox,
-)
+from __future__ import annotations
 
-from i18n import tr
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QCheckBox, QDialog, QDialogButtonBox, QLabel, QVBoxLayout
+
+from i18n import current_locale, tr
+
+_KEYS = ("orphans", "cache", "flatpak", "aur", "logs")
+_EMPTY = dict.fromkeys(_KEYS, False)
 
 
 class CleanupDialog(QDialog):
     """Dialog zur Auswahl der Systempflege-Aktionen."""
 
+    _LABELS: dict[str, str] = {}
+    _LABELS_LOCALE: str | None = None
+
+    @classmethod
+    def _labels(cls) -> dict[str, str]:
+        """Return the translated labels, rebuilt only when the language changes."""
+        locale = current_locale()
+        if cls._LABELS_LOCALE != locale:
+            cls._LABELS = {
+                "title": tr("dialog_cleanup_title"),
+                "intro": tr("cleanup_dialog_intro"),
+                "orphans": tr("cleanup_option_remove_orphans"),
+                "cache": tr("cleanup_option_clean_cache"),
+                "flatpak": tr("cleanup_option_remove_flatpak_runtimes"),
+                "aur": tr("cleanup_option_clear_aur_cache"),
+                "logs": tr("cleanup_option_clean_logs"),
+                "hint": tr("cleanup_dialog_hint"),
+            }
+            cls._LABELS_LOCALE = locale
+        return cls._LABELS
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(tr("dialog_cleanup_title"))
-        self.resize(420, 0)
+        labels = self._labels()
+        self.setWindowTitle(labels["title"])
 
         layout = QVBoxLayout(self)
 
-        info = QLabel(tr("cleanup_dialog_intro"))
+        info = QLabel(labels["intro"])
         info.setWordWrap(True)
         layout.addWidget(info)
 
-        self.chk_orphans = QCheckBox(tr("cleanup_option_remove_orphans"))
-        self.chk_cache = QCheckBox(tr("cleanup_option_clean_cache"))
-        self.chk_flatpak = QCheckBox(tr("cleanup_option_remove_flatpak_runtimes"))
-        self.chk_aur = QCheckBox(tr("cleanup_option_clear_aur_cache"))
-        self.chk_logs = QCheckBox(tr("cleanup_option_clean_logs"))
-
-        for chk in (
-            self.chk_orphans,
-            self.chk_cache,
-            self.chk_flatpak,
-            self.chk_aur,
-            self.chk_logs,
-        ):
-            chk.setChecked(True)
+        # Qt properties passed as keywords are applied during construction.
+        self._boxes = tuple(QCheckBox(labels[key], checked=True) for key in _KEYS)
+        for chk in self._boxes:
             layout.addWidget(chk)
 
-        hint = QLabel(tr("cleanup_dialog_hint"))
+        hint = QLabel(labels["hint"])
         hint.setWordWrap(True)
-        hint.setStyleSheet("color: gray;")
+        palette = hint.palette()
+        palette.setColor(QPalette.WindowText, Qt.gray)
+        hint.setPalette(palette)
         layout.addWidget(hint)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
+        self.setMinimumWidth(420)
+
+    def reset(self):
+        """Check every option again before the dialog is reused."""
+        for box in self._boxes:
+            box.setChecked(True)
 
     def selections(self) -> dict:
-        return {
-            "orphans": self.chk_orphans.isChecked(),
-            "cache": self.chk_cache.isChecked(),
-            "flatpak": self.chk_flatpak.isChecked(),
-            "aur": self.chk_aur.isChecked(),
-            "logs": self.chk_logs.isChecked(),
-        }
+        result = _EMPTY.copy()
+        for key, box in zip(_KEYS, self._boxes):
+            result[key] = box.isChecked()
+        return result
@@ -1,5 +1,7 @@
 """Simple translation system for WrapPac without external dependencies."""
 
+import functools
+
 from settings import settings
 
 # Translation dictionaries
@@ -104,6 +106,7 @@ TRANSLATIONS = {
         "msg_package_list_loading": "== Paketlisten werden geladen (asynchron) ==",
         "status_loading_packages": "Pakete werden geladen …",
         "status_checking_updates": "Updates werden ermittelt …",
+        "status_searching": "Suche läuft …",
         "msg_settings_saved": "Einstellungen gespeichert.",
         "packages": "Pakete",
         "filtered": "gefiltert",
@@ -241,8 +244,9 @@ TRANSLATIONS = {
         # Messages - Flatpak
         "msg_remotes_system_only": "Folgende Remotes existieren nur systemweit: {}\n\nFür eine Installation ohne Root kann ich sie als User-Remote hinzufügen.\nJetzt hinzufügen?",
         "msg_could_not_add_flathub": "Fehler: Konnte 'flathub' nicht hinzufügen.",
+        "msg_could_not_add_remote": "Fehler: Konnte '{}' nicht hinzufügen.",
         "msg_flathub_verify_failed": "Fehler: 'flathub' konnte nach dem Hinzufügen nicht verifiziert werden.",
-        "msg_remote_url_unknown": "Für Remote '{}' kenne ich die URL nicht.\nBitte manuell hinzufügen:\nflatpak remote-add --user {} <URL>",
+        "msg_remote_url_unknown": "Für folgende Remotes kenne ich die URL nicht: {}\nBitte manuell hinzufügen:\n{}",
         "msg_remote_unknown_skip": "Remote '{}' ist unbekannt. Überspringe: {}",
         "msg_missing_remotes_manual": "Es fehlen folgende Remotes: {}\n\nBitte manuell mit 'flatpak remote-add' einrichten oder Auto-Hinzufügen in den Einstellungen aktivieren.",
         "msg_flathub_not_configured": "Der Remote 'flathub' ist nicht eingerichtet.\n\nJetzt als User-Remote hinzufügen?",
@@ -497,6 +501,7 @@ TRANSLATIONS = {
         "msg_package_list_loading": "== Loading package lists (async) ==",
         "status_loading_packages": "Loading packages …",
         "status_checking_updates": "Checking for updates …",
+        "status_searching": "Searching …",
         "msg_settings_saved": "Settings saved.",
         "packages": "packages",
         "filtered": "filtered",
@@ -634,8 +639,9 @@ TRANSLATIONS = {
         # Messages - Flatpak
         "msg_remotes_system_only": "The following remotes exist only system-wide: {}\n\nFor installation without root, I can add them as user remotes.\nAdd now?",
         "msg_could_not_add_flathub": "Error: Could not add 'flathub'.",
+        "msg_could_not_add_remote": "Error: Could not add '{}'.",
         "msg_flathub_verify_failed": "Error: 'flathub' could not be verified after adding.",
-        "msg_remote_url_unknown": "Unknown URL for remote '{}'.\nPlease add manually:\nflatpak remote-add --user {} <URL>",
+        "msg_remote_url_unknown": "Unknown URL for the following remotes: {}\nPlease add manually:\n{}",
         "msg_remote_unknown_skip": "Remote '{}' is unknown. Skipping: {}",
         "msg_missing_remotes_manual": "The following remotes are missing: {}\n\nPlease set up manually with 'flatpak remote-add' or enable auto-add in Settings.",
         "msg_flathub_not_configured": "The remote 'flathub' is not configured.\n\nAdd as user remote now?",
@@ -791,11 +797,41 @@ TRANSLATIONS = {
     },
 }
 
+@functools.lru_cache(maxsize=1)
+def current_locale() -> str:
+    """Return the active language code (cached until set_locale())."""
+
+    return settings.get_language()
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup(key: str) -> str:
+    """Resolve a key for the current language (cached until set_locale())."""
+
+    return TRANSLATIONS.get(current_locale(), {}).get(key, key)
+
+
+def preload() -> None:
+    """Resolve the language and warm the lookup cache for all of its keys.
+
+    Called once at startup so later tr() calls from dialogs are plain cache hits.
+    """
+
+    for key in TRANSLATIONS.get(current_locale(), {}):
+        _lookup(key)
+
+
+def set_locale() -> None:
+    """Drop cached lookups after the language setting has changed."""
+
+    current_locale.cache_clear()
+    _lookup.cache_clear()
+
+
 def tr(key: str, *args, **kwargs) -> str:
     """Translate a key into the current language."""
 
-    lang = settings.get_language()
-    text = TRANSLATIONS.get(lang, {}).get(key, key)
+    text = _lookup(key)
 
     if args or kwargs:
         try:
@@ -1,76 +1,239 @@
-import argparse
+import functools
+import os
 import sys
 import shutil
 import subprocess
 import shlex
+import struct
 import re
 import itertools
 import json
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from html import escape
 from pathlib import Path
-from typing import Optional, List, Dict, Set, Tuple, Sequence, Iterable, Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, List, Dict, Set, Tuple, Sequence, Callable, Iterator
 
 from PySide6 import QtGui
 from PySide6.QtGui import QAction, QKeySequence, QShortcut, QIcon, QFontDatabase
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, Slot
+from PySide6.QtCore import Qt, QCoreApplication, QEventLoop, QMetaObject, QObject, QTimer, QThread, Signal, Slot
 from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QTableView, QMenu,
-    QMessageBox, QDialog, QTableWidget, QTableWidgetItem, QHeaderView,
-    QLabel, QListWidget, QListWidgetItem, QSplitter, QStyle, QCheckBox, QProgressBar,
+    QMessageBox, QDialog, QHeaderView,
+    QLabel, QListView, QListWidget, QListWidgetItem, QSplitter, QStyle, QCheckBox, QProgressBar,
     QDialogButtonBox, QSystemTrayIcon, QPlainTextEdit, QTabWidget, QTextBrowser,
     QFileDialog, QCompleter
 )
 
-from models import PackageModel, PackageItem
+from models import (
+    PackageModel, PackageItem, PreparedFilter, QueueModel, ResultRow, ResultsModel,
+    diff_packages, normalize_result_row,
+)
 import providers
 from managed_terminal import ManagedTerminalWidget
 from settings import settings
 from settings_dialog import SettingsDialog
-from cleanup_dialog import CleanupDialog
+import i18n
 from i18n import tr
 import update_service
 from search_history import SearchHistory
 
+if TYPE_CHECKING:
+    import argparse
+
 
 APP_DIR = Path(__file__).resolve().parent
 ICON_PATH = APP_DIR / "assets" / "wrappac_logo.svg"
 SINGLE_INSTANCE_SERVER_NAME = "wrappac-single-instance"
+# The kernel completes a local connect to a listening instance right away, whether or
+# not its event loop is busy; anything slower than this is a stale socket.
+SINGLE_INSTANCE_TIMEOUT_MS = 50
+# Remotes whose location is known, so they can be added as user remotes without asking.
+WELL_KNOWN_REMOTES: Dict[str, str] = {
+    "flathub": "https://flathub.org/repo/flathub.flatpakrepo",
+    "flathub-beta": "https://flathub.org/beta-repo/flathub-beta.flatpakrepo",
+    "fedora": "oci+https://registry.fedoraproject.org",
+    "gnome-nightly": "https://nightly.gnome.org/gnome-nightly.flatpakrepo",
+}
+
+
+def _remote_add_argv(name: str) -> Tuple[str, ...]:
+    return ("flatpak", "remote-add", "--if-not-exists", "--user", name, WELL_KNOWN_REMOTES[name])
+
 
+FLATHUB_ADD_ARGV = _remote_add_argv("flathub")
+FLATHUB_ADD_CMDLINE = " ".join(FLATHUB_ADD_ARGV)
 
+# Header line of a pacman -Ss hit: "repo/name version [extra]"; the description follows indented.
+_PACMAN_SS_HEAD_RE = re.compile(rb"([a-z0-9\-+_.]+)/(\S+)[ \t]+(\S+)[ \t]*(.*)", re.S)
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_AUR_SS_RE = re.compile(r"^aur/([^\s]+)\s")
+_YAY_BLOCK_SPLIT_RE = re.compile(r"\n{2,}", re.M)
+_YAY_NAME_RE = re.compile(r"^(Name|Package\s*name)\s*:", re.I)
+_YAY_VER_RE = re.compile(r"^(Version)\s*:", re.I)
+_YAY_DESC_RE = re.compile(r"^(Beschreibung|Description)\s*:", re.I)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_app_icon() -> Optional[QIcon]:
     if ICON_PATH.exists():
         return QIcon(str(ICON_PATH))
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _fallback_icon() -> QIcon:
+    """Return the themed information icon; only call once the QApplication exists."""
+    return QApplication.style().standardIcon(QStyle.SP_MessageBoxInformation)
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(cmd: str) -> Optional[str]:
+    """PATH lookup memoized until the next refresh clears it."""
+    return shutil.which(cmd)
+
+
 def _which(cmd: str) -> bool:
-    return shutil.which(cmd) is not None
+    return _which_cached(cmd) is not None
+
+
+def _resolve_argv(argv: List[str]) -> Optional[List[str]]:
+    """argv with its program replaced by the cached PATH lookup, or None if not installed."""
+    exe = _which_cached(argv[0])
+    return [exe, *argv[1:]] if exe else None
 
 def _check_output(args: List[str]) -> str:
     try:
-        return subprocess.check_output(args, text=True, stderr=subprocess.DEVNULL)
+        # Large pipe buffer so long listings are drained in few read() calls.
+        with subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+        ) as proc:
+            out, _ = proc.communicate()
     except Exception:
         return ""
+    # One UTF-8 decode instead of the locale codec plus newline translation of text mode.
+    return out.decode("utf-8", "replace") if proc.returncode == 0 else ""
 
 
-def _notify_running_instance(server_name: str, message: str, timeout_ms: int = 1000) -> bool:
-    """Send a message to a running instance if possible."""
+def _iter_output_lines(args: List[str], env: Optional[Dict[str, str]] = None) -> Iterator[bytes]:
+    """Yield a command's stdout line by line (as bytes) while it is still running."""
+    try:
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+    except Exception:
+        return
+    try:
+        yield from proc.stdout
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+@functools.lru_cache(maxsize=256)
+def _check_output_cached(args: Tuple[str, ...]) -> str:
+    """_check_output() for detail queries, memoized until the next refresh."""
+    return _check_output(list(args))
+
+
+FLATPAK_REMOTE_CONFIGS = (
+    Path.home() / ".local" / "share" / "flatpak" / "repo" / "config",
+    Path("/var/lib/flatpak/repo/config"),
+)
+
+
+def _flatpak_remote_config_stamp() -> Tuple[Optional[float], ...]:
+    """mtimes of the user and system repo configs, which flatpak rewrites on remote changes."""
+    stamp: List[Optional[float]] = []
+    for path in FLATPAK_REMOTE_CONFIGS:
+        try:
+            stamp.append(path.stat().st_mtime)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+_remote_pool = ThreadPoolExecutor(max_workers=2)
+
+_instance_sockets: Dict[str, QLocalSocket] = {}
+
+
+def _spin_until(socket: QLocalSocket, signal, timeout_ms: int) -> None:
+    """Run a local event loop until signal or a socket error fires, or timeout_ms passes."""
+
+    loop = QEventLoop()
+    timer = QTimer(loop)
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
+    signal.connect(loop.quit)
+    socket.errorOccurred.connect(loop.quit)
+    timer.start(timeout_ms)
+    loop.exec()
+    signal.disconnect(loop.quit)
+    socket.errorOccurred.disconnect(loop.quit)
+
+
+def _wait_connected(socket: QLocalSocket, timeout_ms: int) -> bool:
+    if socket.state() == QLocalSocket.ConnectedState:
+        return True
+    if QCoreApplication.instance() is None:
+        # No event loop yet (update-service path); a blocking wait is fine there.
+        return socket.waitForConnected(timeout_ms)
+    _spin_until(socket, socket.connected, timeout_ms)
+    return socket.state() == QLocalSocket.ConnectedState
+
+
+def _wait_written(socket: QLocalSocket, timeout_ms: int) -> bool:
+    if not socket.bytesToWrite():
+        return True
+    if QCoreApplication.instance() is None:
+        return socket.waitForBytesWritten(timeout_ms)
+    _spin_until(socket, socket.bytesWritten, timeout_ms)
+    return not socket.bytesToWrite()
+
+
+def _instance_socket(server_name: str, timeout_ms: int) -> Optional[QLocalSocket]:
+    """Return a connected socket to the running instance, reusing an open one."""
+
+    socket = _instance_sockets.get(server_name)
+    if socket is not None and socket.state() == QLocalSocket.ConnectedState:
+        return socket
 
     socket = QLocalSocket()
     socket.connectToServer(server_name)
-    if not socket.waitForConnected(timeout_ms):
-        return False
+    if not _wait_connected(socket, timeout_ms):
+        _instance_sockets.pop(server_name, None)
+        return None
+
+    _instance_sockets[server_name] = socket
+    return socket
+
+
+def _frame_message(message: str) -> bytes:
+    """Encode an IPC message as a 4-byte big-endian length plus UTF-8 payload."""
+
+    payload = message.encode("utf-8")
+    return struct.pack(">I", len(payload)) + payload
+
 
-    if message:
-        socket.write(message.encode("utf-8"))
-        socket.flush()
-        socket.waitForBytesWritten(timeout_ms)
+def _notify_running_instance(server_name: str, message: str,
+                             timeout_ms: int = SINGLE_INSTANCE_TIMEOUT_MS) -> bool:
+    """Send a message to a running instance if possible."""
+
+    socket = _instance_socket(server_name, timeout_ms)
+    if socket is None:
+        return False
 
-    socket.disconnectFromServer()
-    socket.waitForDisconnected(timeout_ms)
+    socket.write(_frame_message(message))
+    # The frame is a few bytes, so flush() normally hands it all to the kernel and
+    # there is nothing left to wait for.
+    if not socket.flush() and socket.bytesToWrite():
+        _wait_written(socket, timeout_ms)
     return True
 
 
@@ -90,12 +253,16 @@ def _create_single_instance_server(server_name: str) -> Optional[QLocalServer]:
 
 
 def _run_update_service(qt_args: Sequence[str]) -> int:
-    try:
-        pac = providers.updates_pacman_count()
-        aur = providers.updates_aur_count()
-        flp = providers.updates_flatpak_count()
-    except Exception:
-        pac = aur = flp = 0
+    cached = providers.load_cached_updates_counts()
+    if cached is not None:
+        pac, aur, flp = cached
+    else:
+        try:
+            pac, aur, flp = providers.updates_counts()
+        except Exception:
+            pac = aur = flp = 0
+        else:
+            providers.store_updates_counts(pac, aur, flp)
 
     total = pac + aur + flp
     if total <= 0:
@@ -116,7 +283,7 @@ def _run_update_service(qt_args: Sequence[str]) -> int:
 
     icon = _load_app_icon()
     if icon is None:
-        icon = app.style().standardIcon(QStyle.SP_MessageBoxInformation)
+        icon = _fallback_icon()
 
     tray = QSystemTrayIcon(icon)
     tray.setToolTip(tr("update_service_tray_tooltip", total))
@@ -155,40 +322,350 @@ def _run_update_service(qt_args: Sequence[str]) -> int:
     return app.exec()
 
 
-class RefreshThread(QThread):
-    """Load package lists in the background to keep the UI responsive."""
-    finished_with = Signal(list)   # List[PackageItem]
+@dataclass(slots=True)
+class Cmd:
+    """One step of a command sequence run in the embedded terminal."""
+
+    argv: List[str]
+    needs_root: bool = False
+
+
+def _flatpak_install_message_keys(scope: str) -> Tuple[str, str]:
+    """(per-remote, auto-remote) i18n keys for the install progress line of a scope."""
+    if scope == "user":
+        return "msg_installing_flatpak_user", "msg_installing_flatpak_user_auto"
+    return "msg_installing_flatpak_system", "msg_installing_flatpak_system_auto"
+
+
+def _fuse_root_commands(cmds: List[Cmd]) -> List[Cmd]:
+    """Join consecutive root commands into one shell chain so they share a single authentication."""
+    fused: List[Cmd] = []
+    run: List[Cmd] = []
+
+    def _flush_run():
+        if len(run) == 1:
+            fused.append(run[0])
+        elif run:
+            # Every step runs whatever the previous one returned, as when they
+            # were run one by one, but the chain exits with the first failing
+            # code so the sequence is not reported as a success.
+            steps = "; ".join(
+                f'{shlex.join(cmd.argv)} || {{ s=$?; [ "$rc" -ne 0 ] || rc=$s; }}' for cmd in run
+            )
+            fused.append(Cmd(["bash", "-lc", f"rc=0; {steps}; exit $rc"], needs_root=True))
+        run.clear()
+
+    for cmd in cmds:
+        if cmd.needs_root:
+            run.append(cmd)
+        else:
+            _flush_run()
+            fused.append(cmd)
+    _flush_run()
+    return fused
+
+
+def _search_pacman(term: str) -> List[Dict[str, str]]:
+    if not _which("pacman"):
+        return []
+    # Parse hits as pacman prints them instead of buffering the whole listing.
+    rows: List[Dict[str, str]] = []
+    desc: List[bytes] = []
+
+    def _finish():
+        if desc:
+            rows[-1]["description"] = " ".join(b" ".join(desc).decode("utf-8", "replace").split())
+
+    for ln in _iter_output_lines(["pacman", "-Ss", term]):
+        if ln[:1] in (b" ", b"\t"):
+            if desc:
+                desc.append(ln)
+            continue
+        _finish()
+        desc = []
+        m = _PACMAN_SS_HEAD_RE.match(ln)
+        if not m:
+            continue
+        desc = [m[4]]
+        rows.append({
+            "name": m[2].decode("utf-8", "replace"),
+            "repo": m[1].decode("utf-8", "replace"),
+            "version": m[3].decode("utf-8", "replace"),
+            "description": "",
+            "source": "Repo",
+        })
+    _finish()
+    return rows
+
+
+def _search_aur(term: str) -> List[Dict[str, str]]:
+    tool = settings.get_aur_helper()
+    if not tool:
+        return []
+
+    env = os.environ.copy()
+    env["YAY_PAGER"] = "cat"
+    env["PAGER"] = "cat"
+    env["NO_COLOR"] = "1"
+    env["LC_ALL"] = env.get("LC_ALL", "C")
+    env["LANG"] = env.get("LANG", "C")
+
+    names = [
+        name
+        for name in (ln.decode("utf-8", "replace").strip()
+                     for ln in _iter_output_lines([tool, "-Ssq", "--aur", term], env=env))
+        if name
+    ]
+    if not names:
+        try:
+            out_raw = subprocess.check_output([tool, "-Ss", term], text=True, stderr=subprocess.DEVNULL, env=env)
+        except Exception:
+            out_raw = ""
+        out_raw = _ANSI_RE.sub("", out_raw)
+        for ln in out_raw.splitlines():
+            m = _AUR_SS_RE.match(ln)
+            if m:
+                names.append(m.group(1))
+
+    # Drop repeats from either listing before capping, so every -Si slot
+    # (and every returned row) is a distinct package.
+    seen: Set[str] = set()
+    names = [n for n in names if not (n in seen or seen.add(n))]
+    if not names:
+        return []
+
+    MAX_NAMES = 100
+    names = names[:MAX_NAMES]
+
+    # Work from a local copy: refresh() may clear the shared cache while this
+    # search runs on the pool.
+    found = {n: info for n in names if (info := _aur_info_cache.get(n)) is not None}
+    missing = [n for n in names if n not in found]
+    if missing:
+        for r in _aur_info(tool, missing, env):
+            r["repo"] = "aur"
+            r.setdefault("source", "AUR")
+            _aur_info_cache[r["name"]] = r
+            found[r["name"]] = r
+
+    return [dict(found[n]) for n in names if n in found]
+
+
+# `-Si` results by package name; cleared on refresh so versions stay current.
+_aur_info_cache: Dict[str, Dict[str, str]] = {}
 
-    def __init__(self, parent=None):
+
+def _aur_info_chunk_size(names: List[str]) -> int:
+    """Largest number of names per `-Si` call that stays well inside ARG_MAX."""
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = 131072
+    longest = max(len(n) for n in names) + 1
+    return max(1, (arg_max // 4) // longest)
+
+
+def _aur_info(tool: str, names: List[str], env: Dict[str, str]) -> List[Dict[str, str]]:
+    size = _aur_info_chunk_size(names)
+    if size >= len(names):
+        try:
+            out_info = subprocess.check_output(
+                [tool, "-Si", *names],
+                text=True, stderr=subprocess.DEVNULL, env=env
+            )
+        except Exception:
+            # One bad name fails the whole call; retry in small chunks below.
+            size = 25
+        else:
+            return _parse_yay_si(out_info)
+
+    rows: List[Dict[str, str]] = []
+    for chunk in _split_chunks(names, size):
+        try:
+            out_info = subprocess.check_output(
+                [tool, "-Si", *chunk],
+                text=True, stderr=subprocess.DEVNULL, env=env
+            )
+        except Exception:
+            continue
+        rows.extend(_parse_yay_si(out_info))
+    return rows
+
+
+def _split_chunks(seq, n):
+    it = iter(seq)
+    while True:
+        chunk = list(itertools.islice(it, n))
+        if not chunk:
+            break
+        yield chunk
+
+
+def _parse_yay_si(text: str) -> List[Dict[str, str]]:
+    text = _ANSI_RE.sub("", text)
+    blocks = _YAY_BLOCK_SPLIT_RE.split(text.strip())
+
+    results: List[Dict[str, str]] = []
+    for blk in blocks:
+        name = version = desc = ""
+        for ln in blk.splitlines():
+            ln = ln.strip()
+            if not ln:
+                continue
+            if _YAY_NAME_RE.match(ln):
+                name = ln.split(":", 1)[1].strip()
+            elif _YAY_VER_RE.match(ln):
+                version = ln.split(":", 1)[1].strip()
+            elif _YAY_DESC_RE.match(ln):
+                desc = ln.split(":", 1)[1].strip()
+        if name:
+            results.append({
+                "name": name,
+                "version": version,
+                "description": desc,
+                "repo": "aur",
+                "source": "AUR",
+            })
+    return results
+
+
+def _flatpak_search(term: str) -> List[Dict[str, str]]:
+    if not _which("flatpak"):
+        return []
+    # Parse lines as flatpak emits them; split as bytes and decode only the
+    # six cells that are kept.
+    rows: List[Dict[str, str]] = []
+    for ln in _iter_output_lines(
+        ["flatpak", "search", "--columns=application,name,description,branch,remotes,version", term]
+    ):
+        parts = ln.split(b"\t", 5)
+        if len(parts) < 6 or parts[0].lower() == b"application":
+            continue
+        application, name, description, branch, remotes, version = (
+            p.decode("utf-8", "replace") for p in parts
+        )
+        rows.append({
+            "application": application,
+            "name": name,
+            "description": description,
+            "branch": branch,
+            "remotes": remotes,
+            "version": version.rstrip(),
+            "source": "Flatpak",
+        })
+    return rows
+
+
+_SEARCH_BACKENDS: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
+    "Repo": _search_pacman,
+    "AUR": _search_aur,
+    "Flatpak": _flatpak_search,
+}
+
+_search_pool = ThreadPoolExecutor(max_workers=len(_SEARCH_BACKENDS))
+
+
+def _iter_search_results(source: str, term: str) -> Iterator[List[Dict[str, str]]]:
+    """Yield each backend's hits as soon as that backend is done."""
+    search = _SEARCH_BACKENDS.get(source)
+    if search is not None:
+        yield search(term)
+        return
+    # The backends are independent subprocesses, so "Alle" runs them side by
+    # side and hands over whichever finishes first.
+    futures = [_search_pool.submit(search, term) for search in _SEARCH_BACKENDS.values()]
+    for future in as_completed(futures):
+        try:
+            yield future.result()
+        except Exception:
+            pass
+
+
+class SearchThread(QThread):
+    """Run package searches in the background to keep the UI responsive."""
+
+    rows_ready = Signal(list)   # List[ResultRow], once per finished backend
+
+    def __init__(self, parent=None, source: str = "Alle", term: str = ""):
         super().__init__(parent)
+        self._source = source
+        self._term = term
 
     def run(self):
         try:
-            pkgs = providers.list_all()
+            for rows in _iter_search_results(self._source, self._term):
+                if rows:
+                    self.rows_ready.emit([normalize_result_row(r, self._source) for r in rows])
+        except Exception:
+            pass
+
+
+REFRESH_BATCH_SIZE = 500
+
+
+class RefreshWorker(QObject):
+    """Load package lists in the background to keep the UI responsive.
+
+    Lives on a thread owned by MainWindow for its whole lifetime; every
+    run() call is one refresh.
+    """
+    batch_ready = Signal(list)             # List[PackageItem], initial load only
+    finished_with = Signal(list, object)   # List[PackageItem], (added, removed, updated) or None
+    done = Signal()
+
+    @Slot(object)
+    def run(self, previous: Optional[Dict[Tuple[str, str], PackageItem]]):
+        try:
+            self._load(previous)
+        finally:
+            self.done.emit()
+
+    def _load(self, previous: Optional[Dict[Tuple[str, str], PackageItem]]):
+        if previous:
+            try:
+                pkgs = providers.list_all()
+            except Exception:
+                pkgs = []
+            self.finished_with.emit(pkgs, diff_packages(previous, pkgs))
+            return
+
+        # Initial load: hand rows over per source in batches so the table
+        # fills while the slower providers are still running.
+        pkgs: List[PackageItem] = []
+        try:
+            for part in providers.iter_all():
+                for start in range(0, len(part), REFRESH_BATCH_SIZE):
+                    self.batch_ready.emit(part[start:start + REFRESH_BATCH_SIZE])
+                pkgs.extend(part)
         except Exception:
-            pkgs = []
-        self.finished_with.emit(pkgs)
+            pass
+        self.finished_with.emit(pkgs, None)
 
 
-class UpdateCheckThread(QThread):
+class UpdateCheckWorker(QObject):
     """Collect update counters in the background."""
 
     finished_with = Signal(int, int, int)
+    done = Signal()
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
+    @Slot()
     def run(self):
         try:
-            pac = providers.updates_pacman_count()
-            aur = providers.updates_aur_count()
-            flp = providers.updates_flatpak_count()
-        except Exception:
-            pac = aur = flp = 0
-        self.finished_with.emit(pac, aur, flp)
+            try:
+                pac, aur, flp = providers.updates_counts()
+            except Exception:
+                pac = aur = flp = 0
+            else:
+                providers.store_updates_counts(pac, aur, flp)
+            self.finished_with.emit(pac, aur, flp)
+        finally:
+            self.done.emit()
 
 
 class MainWindow(QMainWindow):
+    _refresh_requested = Signal(object)
+    _update_check_requested = Signal()
+
     def __init__(self, show_updates: bool = False, tray_mode: bool = False):
         super().__init__()
         self._tray_mode = tray_mode
@@ -199,12 +676,27 @@ class MainWindow(QMainWindow):
         self.resize(1300, 820)
 
         self.current_source: str = "Alle"
-        self.install_queue: List[Tuple[str, str, Dict[str, str]]] = []
-        self._refresh_thread: Optional[RefreshThread] = None
-        self._update_thread: Optional[UpdateCheckThread] = None
+        self.queue_model = QueueModel(self.style().standardIcon(QStyle.SP_ArrowRight))
+        self._update_running = False
         self._is_loading: bool = False
         self._update_indicator_state: Optional[Tuple[bool, str]] = None
+        self._search_thread: Optional[SearchThread] = None
+        self._flatpak_scope_map: Dict[str, str] = {}
+        self._remotes_cache: Optional[Dict[str, Set[str]]] = None
+        self._remotes_cache_mtime: Optional[Tuple[Optional[float], ...]] = None
+        # Cleared once the combined `flatpak remotes` listing proves unusable.
+        self._remotes_combined_ok = True
+        self._remotes_prefetch: Optional[Future] = None
+        self._search_indicator_state: Optional[Tuple[bool, str]] = None
         self._single_instance_server: Optional[QLocalServer] = None
+        # Per-connection IPC state: unparsed bytes, and whether any command arrived.
+        self._ipc_buffers: Dict[QLocalSocket, bytes] = {}
+        self._ipc_handled: Set[QLocalSocket] = set()
+        # Commands a second instance may send; every command also focuses the window.
+        self._ipc_dispatch: Dict[str, Callable[[], None]] = {
+            "show": lambda: None,
+            "show-updates": self._post_system_update_dialog,
+        }
         self._notification_tray: Optional[QSystemTrayIcon] = None
         self._explicit_packages: Optional[Set[str]] = None
         self._dependency_packages: Optional[Set[str]] = None
@@ -222,7 +714,11 @@ class MainWindow(QMainWindow):
         self.installed_search_edit = QLineEdit()
         self.installed_search_edit.setPlaceholderText(tr("installed_filter_placeholder"))
         self.installed_search_edit.setClearButtonEnabled(True)
-        self.installed_search_edit.textChanged.connect(self._on_installed_filter_changed)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(250)
+        self._filter_timer.timeout.connect(self._on_installed_filter_changed)
+        self.installed_search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
 
         self.btn_all = QPushButton(tr("btn_all"))
         self.btn_repo = QPushButton(tr("btn_official"))
@@ -232,10 +728,10 @@ class MainWindow(QMainWindow):
             b.setCheckable(True)
         self.btn_all.setChecked(True)
 
-        self.btn_all.clicked.connect(lambda: self._set_src("Alle"))
-        self.btn_repo.clicked.connect(lambda: self._set_src("Repo"))
-        self.btn_aur.clicked.connect(lambda: self._set_src("AUR"))
-        self.btn_flatpak.clicked.connect(lambda: self._set_src("Flatpak"))
+        self.btn_all.clicked.connect(functools.partial(self._set_src, "Alle"))
+        self.btn_repo.clicked.connect(functools.partial(self._set_src, "Repo"))
+        self.btn_aur.clicked.connect(functools.partial(self._set_src, "AUR"))
+        self.btn_flatpak.clicked.connect(functools.partial(self._set_src, "Flatpak"))
 
         self.btn_refresh = QPushButton(tr("btn_refresh"))
         self.btn_refresh.clicked.connect(self.refresh)
@@ -264,13 +760,17 @@ class MainWindow(QMainWindow):
         self.btn_search.clicked.connect(self._on_search_clicked)
         self.search_info = QLabel(tr("search_info_select_source"))
         self.search_info.setStyleSheet("color: gray;")
-        self.results = QTableWidget(0, 6)
+        self._results_model = ResultsModel()
+        self.results = QTableView()
+        self.results.setModel(self._results_model)
         self._setup_results_table()
         self.results.setContextMenuPolicy(Qt.CustomContextMenu)
         self.results.customContextMenuRequested.connect(self._ctx_menu_results)
 
-        self.queue_list = QListWidget()
-        self.queue_list.setSelectionMode(QListWidget.ExtendedSelection)
+        self.queue_list = QListView()
+        self.queue_list.setModel(self.queue_model)
+        self.queue_list.setSelectionMode(QListView.ExtendedSelection)
+        self.queue_list.setUniformItemSizes(True)
         self.btn_queue_install = QPushButton(tr("btn_install_queue"))
         self.btn_queue_clear = QPushButton(tr("btn_clear_queue"))
         self.btn_queue_remove = QPushButton(tr("btn_remove_from_queue"))
@@ -294,18 +794,27 @@ class MainWindow(QMainWindow):
 
         self.console = ManagedTerminalWidget(self)
         self.console.contextMenuEvent = self._console_context_menu  # type: ignore[attr-defined]
+        self._console_menu: Optional[QMenu] = None
+        # (locale, dialog) pairs kept hidden between opens.
+        self._settings_dialog: Optional[Tuple[str, QDialog]] = None
+        self._cleanup_dialog: Optional[Tuple[str, QDialog]] = None
         self.runner = self.console
         self._default_terminal_font_size = int(settings.DEFAULTS.get("terminal_font_size", 10))
         font_size = settings.get("terminal_font_size", 10)
         font = self.console.font
         font.setPointSize(font_size)
         self.console.font = font
+        self._font_sig = self._terminal_font_signature()
 
         if settings.get("terminal_theme") == "dark":
             pass
 
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(500)
+        self._refresh_debounce.timeout.connect(self.refresh)
+
         self._runner_finished_handler = lambda _code: self._schedule_refresh()
-        self.runner.started.connect(lambda: None)
         self.runner.finished.connect(self._runner_finished_handler)
 
         topbar = QHBoxLayout()
@@ -383,15 +892,34 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel()
         self.statusbar.addPermanentWidget(self.status_label)
 
+        # Background workers keep one thread each for the window's lifetime
+        # instead of spawning a thread per refresh or update check.
+        self._refresh_worker = RefreshWorker()
+        self._refresh_worker.batch_ready.connect(self.model.append_items)
+        self._refresh_worker.finished_with.connect(self._on_refresh_finished)
+        self._refresh_worker.done.connect(self._on_refresh_worker_done)
+        self._refresh_requested.connect(self._refresh_worker.run)
+        self._update_worker = UpdateCheckWorker()
+        self._update_worker.finished_with.connect(self._on_update_counts_ready)
+        self._update_worker.done.connect(self._on_update_worker_done)
+        self._update_check_requested.connect(self._update_worker.run)
+        self._worker_threads = [
+            self._start_worker_thread(self._refresh_worker),
+            self._start_worker_thread(self._update_worker),
+        ]
+        QApplication.instance().aboutToQuit.connect(self._stop_worker_threads)
+
         self._build_menu()
         self._apply_settings()
         self.refresh()
+        # Warm the remotes listing once the window is up so installs don't wait on it.
+        QTimer.singleShot(0, self._prefetch_flatpak_remotes)
 
         if tray_mode:
             self.hide()
         else:
             if show_updates:
-                QTimer.singleShot(300, self._system_update_dialog)
+                self._post_system_update_dialog()
             self.show()
 
         self.search_edit.returnPressed.connect(self.btn_search.click)
@@ -411,9 +939,9 @@ class MainWindow(QMainWindow):
             QShortcut(QKeySequence(key), self).activated.connect(handler)
 
         font_shortcuts = [
-            ("Ctrl++", lambda: self._adjust_terminal_font(1)),
-            ("Ctrl+=", lambda: self._adjust_terminal_font(1)),
-            ("Ctrl+-", lambda: self._adjust_terminal_font(-1)),
+            ("Ctrl++", functools.partial(self._adjust_terminal_font, 1)),
+            ("Ctrl+=", functools.partial(self._adjust_terminal_font, 1)),
+            ("Ctrl+-", functools.partial(self._adjust_terminal_font, -1)),
             ("Ctrl+0", self._reset_terminal_font),
         ]
 
@@ -496,39 +1024,59 @@ class MainWindow(QMainWindow):
             socket = self._single_instance_server.nextPendingConnection()
             if not socket:
                 continue
-            socket.setProperty("wrappac_handled", False)
-            socket.readyRead.connect(lambda s=socket: self._process_single_instance_socket(s))
-            socket.disconnected.connect(lambda s=socket: self._on_single_instance_socket_disconnected(s))
+            self._ipc_buffers[socket] = b""
+            socket.readyRead.connect(self._on_single_instance_ready_read)
+            socket.disconnected.connect(self._on_single_instance_socket_disconnected)
             if socket.bytesAvailable():
                 self._process_single_instance_socket(socket)
 
+    @Slot()
+    def _on_single_instance_ready_read(self) -> None:
+        self._process_single_instance_socket(self.sender())
+
     def _process_single_instance_socket(self, socket: QLocalSocket) -> None:
         if not socket or not socket.bytesAvailable():
             return
 
-        data = bytes(socket.readAll()).decode("utf-8", errors="ignore").strip()
-        if not data:
-            data = "show"
+        pending = self._ipc_buffers.get(socket)
+        chunk = socket.readAll().data()
+        # Only join when an earlier readyRead left a partial frame behind.
+        data = pending + chunk if pending else chunk
+        offset = 0
+        # Each message is framed as a 4-byte big-endian length plus payload;
+        # the sender keeps the connection open for further messages.
+        while len(data) - offset >= 4:
+            (length,) = struct.unpack_from(">I", data, offset)
+            end = offset + 4 + length
+            if len(data) < end:
+                break  # Frame incomplete, wait for the next readyRead.
+            payload = data[offset + 4:end]
+            offset = end
+            command = payload.decode("utf-8", errors="ignore").strip() or "show"
+            self._handle_single_instance_command(command)
+            self._ipc_handled.add(socket)
+
+        self._ipc_buffers[socket] = data[offset:]
 
-        self._handle_single_instance_command(data)
-        socket.setProperty("wrappac_handled", True)
-        socket.disconnectFromServer()
-
-    def _on_single_instance_socket_disconnected(self, socket: QLocalSocket) -> None:
+    @Slot()
+    def _on_single_instance_socket_disconnected(self) -> None:
+        socket = self.sender()
         if not socket:
             return
 
-        handled = bool(socket.property("wrappac_handled"))
-        if not handled:
+        self._ipc_buffers.pop(socket, None)
+        if socket in self._ipc_handled:
+            self._ipc_handled.discard(socket)
+        else:
             self._handle_single_instance_command("show")
 
         socket.deleteLater()
 
     def _handle_single_instance_command(self, command: str) -> None:
         self._focus_main_window()
-        normalized = command.strip().lower()
-        if normalized in {"--show-updates", "show-updates"}:
-            QTimer.singleShot(150, self._system_update_dialog)
+        handler = self._ipc_dispatch.get(command.strip().lower().lstrip("-"))
+        if handler is not None:
+            handler()
 
     def _focus_main_window(self) -> None:
         if self.isMinimized():
@@ -541,6 +1089,19 @@ class MainWindow(QMainWindow):
         if handle is not None:
             handle.requestActivate()
 
+    def _start_worker_thread(self, worker: QObject) -> QThread:
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.finished.connect(worker.deleteLater)
+        thread.start()
+        return thread
+
+    @Slot()
+    def _stop_worker_threads(self):
+        for thread in self._worker_threads:
+            thread.quit()
+            thread.wait()
+
     def closeEvent(self, event):
         """Handle window close event."""
         if self._tray_mode:
@@ -553,20 +1114,44 @@ class MainWindow(QMainWindow):
             event.accept()
             super().closeEvent(event)
 
+    def _reusable_dialog(self, attr: str, factory: Callable[[QWidget], QDialog]) -> QDialog:
+        """Return the dialog cached under attr, rebuilding it after a language change."""
+        cached = getattr(self, attr)
+        locale = i18n.current_locale()
+        if cached is not None and cached[0] == locale:
+            dlg = cached[1]
+            dlg.reset()
+            return dlg
+        if cached is not None:
+            cached[1].deleteLater()
+        dlg = factory(self)
+        setattr(self, attr, (locale, dlg))
+        return dlg
+
     def _show_settings(self):
-        dlg = SettingsDialog(self)
+        dlg = self._reusable_dialog("_settings_dialog", SettingsDialog)
         if dlg.exec() == QDialog.Accepted:
             self._apply_settings()
             self.console.feed_text(tr("msg_settings_saved") + "\n")
 
+    @staticmethod
+    def _terminal_font_signature() -> Tuple[int, str]:
+        return (int(settings.get("terminal_font_size", 10)), str(settings.get("terminal_theme", "")))
+
     def _apply_settings(self):
-        font_size = settings.get("terminal_font_size", 10)
-        font = self.console.font
-        font.setPointSize(font_size)
-        self.console.font = font
-        self.console.fm = QtGui.QFontMetrics(font)
-        self.console.char_w = self.console.fm.horizontalAdvance("M")
-        self.console.char_h = self.console.fm.height()
+        if self._console_menu is not None:
+            self._console_menu.deleteLater()
+            self._console_menu = None
+
+        font_sig = self._terminal_font_signature()
+        if font_sig != self._font_sig:
+            self._font_sig = font_sig
+            font = self.console.font
+            font.setPointSize(font_sig[0])
+            self.console.font = font
+            self.console.fm = QtGui.QFontMetrics(font)
+            self.console.char_w = self.console.fm.horizontalAdvance("M")
+            self.console.char_h = self.console.fm.height()
 
         self.btn_refresh.setText(tr("btn_refresh"))
         self.btn_system_update.setText(tr("btn_system_update"))
@@ -576,6 +1161,11 @@ class MainWindow(QMainWindow):
         self.installed_search_edit.setPlaceholderText(tr("installed_filter_placeholder"))
         self._update_status_info()
 
+    def _post_system_update_dialog(self):
+        """Open the update dialog on the next event-loop pass, once the window is up."""
+        QMetaObject.invokeMethod(self, "_system_update_dialog", Qt.QueuedConnection)
+
+    @Slot()
     def _system_update_dialog(self):
         if self.runner.is_running():
             QMessageBox.information(
@@ -584,7 +1174,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        if self._update_thread and self._update_thread.isRunning():
+        if self._update_running:
             return
 
         self.console.feed_text(tr("msg_update_check_start") + "\n")
@@ -597,10 +1187,8 @@ class MainWindow(QMainWindow):
         self.loading_indicator.setFormat(tr("status_checking_updates"))
         self.loading_indicator.setVisible(True)
 
-        self._update_thread = UpdateCheckThread(self)
-        self._update_thread.finished_with.connect(self._on_update_counts_ready)
-        self._update_thread.finished.connect(self._on_update_thread_finished)
-        self._update_thread.start()
+        self._update_running = True
+        self._update_check_requested.emit()
 
     @Slot(int, int, int)
     def _on_update_counts_ready(self, pac: int, aur: int, flp: int):
@@ -619,11 +1207,9 @@ class MainWindow(QMainWindow):
             )
 
     @Slot()
-    def _on_update_thread_finished(self):
+    def _on_update_worker_done(self):
         self.btn_system_update.setEnabled(True)
-        if self._update_thread:
-            self._update_thread.deleteLater()
-            self._update_thread = None
+        self._update_running = False
         self._restore_update_indicator()
 
     def _restore_update_indicator(self):
@@ -696,36 +1282,33 @@ class MainWindow(QMainWindow):
             )
             return
 
-        cmds: list[Sequence[str] | dict | tuple] = []
+        cmds: List[Cmd] = []
 
-        if do_pac and shutil.which("pacman"):
+        if do_pac and _which("pacman"):
             if preview:
-                cmds.append(["pacman", "-Qu"])
+                cmds.append(Cmd(["pacman", "-Qu"]))
             else:
                 base_cmd = ["pacman", "-Syu"]
                 if not settings.get("pacman_noconfirm", False):
-                    cmds.append(base_cmd)
+                    cmds.append(Cmd(base_cmd, needs_root=True))
                 else:
-                    cmds.append(base_cmd + ["--noconfirm"])
+                    cmds.append(Cmd(base_cmd + ["--noconfirm"], needs_root=True))
 
         if do_aur:
             tool = settings.get_aur_helper()
             if tool:
                 if preview:
-                    cmds.append([tool, "-Qua"])
+                    cmds.append(Cmd([tool, "-Qua"]))
                 else:
-                    cmds.append([tool, "-Syu"])
+                    cmds.append(Cmd([tool, "-Syu"]))
 
-        if do_flp and shutil.which("flatpak"):
+        if do_flp and _which("flatpak"):
             if preview:
-                cmds.append(["flatpak", "remote-ls", "--updates", "--user"])
-                cmds.append(["flatpak", "remote-ls", "--updates", "--system"])
+                cmds.append(Cmd(["flatpak", "remote-ls", "--updates", "--user"]))
+                cmds.append(Cmd(["flatpak", "remote-ls", "--updates", "--system"]))
             else:
-                cmds.append(["flatpak", "update", "--user", "-y"])
-                cmds.append({
-                    "argv": ["flatpak", "update", "--system", "-y"],
-                    "needs_root": True,
-                })
+                cmds.append(Cmd(["flatpak", "update", "--user", "-y"]))
+                cmds.append(Cmd(["flatpak", "update", "--system", "-y"], needs_root=True))
 
         if not cmds:
             QMessageBox.information(
@@ -744,7 +1327,9 @@ class MainWindow(QMainWindow):
             )
             return
 
-        dlg = CleanupDialog(self)
+        from cleanup_dialog import CleanupDialog
+
+        dlg = self._reusable_dialog("_cleanup_dialog", CleanupDialog)
         if dlg.exec() != QDialog.Accepted:
             return
 
@@ -778,12 +1363,13 @@ class MainWindow(QMainWindow):
     def _execute_cleanup_actions(self, selections: Dict[str, bool]):
         """Execute cleanup with single root authentication."""
         root_cmds: List[str] = []
-        user_cmds: List[Dict[str, object]] = []
+        # Shell fragments run together in one unprivileged bash.
+        user_cmds: List[str] = []
 
         self.console.feed_text(tr("msg_cleanup_start") + "\n")
 
         if selections.get("orphans"):
-            if shutil.which("pacman"):
+            if _which("pacman"):
                 message_no_orphans = tr("msg_cleanup_orphans_none")
                 script = (
                     "orphans=$(pacman -Qtdq); "
@@ -796,7 +1382,7 @@ class MainWindow(QMainWindow):
                 self.console.feed_text(tr("cleanup_skip_orphans_missing") + "\n")
 
         if selections.get("cache"):
-            if shutil.which("pacman"):
+            if _which("pacman"):
                 keep = max(0, int(settings.get("cleanup_keep_pkg_versions", 2)))
                 fallback_note = tr("msg_cleanup_cache_fallback")
                 script = (
@@ -811,18 +1397,15 @@ class MainWindow(QMainWindow):
                 self.console.feed_text(tr("cleanup_skip_cache_missing") + "\n")
 
         if selections.get("flatpak"):
-            if shutil.which("flatpak"):
-                user_cmds.append({
-                    "argv": ["flatpak", "uninstall", "--user", "--unused", "-y"],
-                    "needs_root": False,
-                })
+            if _which("flatpak"):
+                user_cmds.append("flatpak uninstall --user --unused -y")
                 if settings.get("flatpak_default_scope", "user") == "system":
                     root_cmds.append("flatpak uninstall --system --unused -y")
             else:
                 self.console.feed_text(tr("cleanup_skip_flatpak_missing") + "\n")
 
         if selections.get("logs"):
-            if shutil.which("journalctl"):
+            if _which("journalctl"):
                 days = max(1, int(settings.get("cleanup_log_max_age_days", 14)))
                 root_cmds.append(f"journalctl --vacuum-time={days}d")
             else:
@@ -839,12 +1422,9 @@ class MainWindow(QMainWindow):
                 "find \"$dir\" -mindepth 1 -maxdepth 1 -exec rm -rf {} +; fi; done; "
                 f"echo {shlex.quote(done_msg)}"
             )
-            user_cmds.append({
-                "argv": ["bash", "-lc", script],
-                "needs_root": False,
-            })
+            user_cmds.append(script)
 
-        cmds: List[Dict[str, object]] = []
+        cmds: List[Cmd] = []
 
         if root_cmds:
             root_method = settings.get_root_command()
@@ -852,12 +1432,11 @@ class MainWindow(QMainWindow):
                 self.console.feed_text(tr("msg_no_root_method") + "\n")
             else:
                 combined = " && ".join(root_cmds)
-                cmds.append({
-                    "argv": root_method + ["bash", "-lc", combined],
-                    "needs_root": False,
-                })
+                cmds.append(Cmd(root_method + ["bash", "-lc", combined]))
 
-        cmds.extend(user_cmds)
+        if user_cmds:
+            # Independent steps: keep going if one of them fails.
+            cmds.append(Cmd(["bash", "-lc", "; ".join(user_cmds)]))
 
         if not cmds:
             self.console.feed_text(tr("cleanup_no_action_possible") + "\n")
@@ -871,31 +1450,13 @@ class MainWindow(QMainWindow):
 
     def _run_cmds_sequential(
         self,
-        cmds: List[Sequence[str] | Dict[str, object] | Tuple[Iterable[str], bool]],
+        cmds: List[Cmd],
         *,
         final_message: Optional[str] = None,
         schedule_refresh: bool = True,
         on_done: Optional[Callable[[bool], None]] = None,
     ):
-        normalized: List[Tuple[List[str], bool]] = []
-        for cmd in cmds:
-            argv: List[str]
-            needs_root = False
-            if isinstance(cmd, dict):
-                raw = cmd.get("argv", [])
-                argv = list(raw) if isinstance(raw, Iterable) else []
-                needs_root = bool(cmd.get("needs_root", False))
-            elif isinstance(cmd, tuple):
-                seq, needs_root = cmd
-                argv = list(seq)
-                needs_root = bool(needs_root)
-            else:
-                argv = list(cmd)
-                needs_root = self._command_requires_root(argv)
-
-            if not argv:
-                continue
-            normalized.append((argv, needs_root))
+        normalized = _fuse_root_commands([cmd for cmd in cmds if cmd.argv])
 
         message = final_message if final_message is not None else tr("msg_updates_complete")
 
@@ -911,7 +1472,7 @@ class MainWindow(QMainWindow):
                 self._schedule_refresh()
             return
 
-        self._cmd_queue = list(normalized)
+        self._cmd_queue = normalized
         completed_codes: List[int] = []
 
         try:
@@ -967,8 +1528,9 @@ class MainWindow(QMainWindow):
                 _finish_sequence()
                 return
 
-            argv, needs_root = self._cmd_queue.pop(0)
-            if needs_root:
+            cmd = self._cmd_queue.pop(0)
+            argv = cmd.argv
+            if cmd.needs_root:
                 root_cmd = settings.get_root_command()
                 if root_cmd:
                     argv = root_cmd + argv
@@ -982,15 +1544,6 @@ class MainWindow(QMainWindow):
         self.runner.finished.connect(_on_command_finished)
         _run_next()
 
-    def _command_requires_root(self, argv: List[str]) -> bool:
-        if not argv:
-            return False
-        if argv[0] in {"pacman", "reflector", "paccache", "journalctl"}:
-            if argv[0] == "pacman" and len(argv) >= 2 and argv[1] == "-Qu":
-                return False
-            return True
-        return False
-
     def _run_reflector(self):
         if self.runner.is_running():
             QMessageBox.information(
@@ -1016,7 +1569,7 @@ class MainWindow(QMainWindow):
 
         self.console.feed_text(tr("msg_reflector_start") + "\n")
         self._run_cmds_sequential(
-            [cmd],
+            [Cmd(cmd, needs_root=True)],
             final_message=tr("msg_reflector_complete"),
             schedule_refresh=False,
         )
@@ -1032,20 +1585,11 @@ class MainWindow(QMainWindow):
             self.btn_reflector.setToolTip(tr("tooltip_reflector_ready"))
 
     def _setup_results_table(self):
-        self.results.setRowCount(0)
-        self.results.setColumnCount(6)
-        self.results.setHorizontalHeaderLabels([
-            tr("table_package"),
-            tr("table_version"),
-            tr("table_branch_repo"),
-            tr("table_remote_source"),
-            tr("table_source"),
-            tr("table_description")
-        ])
+        self._results_model.clear()
         self.results.verticalHeader().setVisible(False)
-        self.results.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.results.setSelectionBehavior(QTableWidget.SelectRows)
-        self.results.setSelectionMode(QTableWidget.ExtendedSelection)
+        self.results.setEditTriggers(QTableView.NoEditTriggers)
+        self.results.setSelectionBehavior(QTableView.SelectRows)
+        self.results.setSelectionMode(QTableView.ExtendedSelection)
         self.results.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.results.horizontalHeader().setStretchLastSection(True)
         self.results.setSortingEnabled(True)
@@ -1054,8 +1598,10 @@ class MainWindow(QMainWindow):
 
     def _schedule_refresh(self):
         if settings.get("auto_refresh_after_install", True):
+            # Restarting the timer coalesces bursts of finished commands into one refresh.
             delay = settings.get("refresh_delay_ms", 400)
-            QTimer.singleShot(delay, self.refresh)
+            self._refresh_debounce.setInterval(int(delay))
+            self._refresh_debounce.start()
 
     def _send_sigint(self):
         self.runner.send_sigint()
@@ -1068,8 +1614,9 @@ class MainWindow(QMainWindow):
         self._update_search_placeholder()
         self._apply_advanced_filters()
 
-    def _on_installed_filter_changed(self, text: str):
-        self.model.set_text_filter(text.strip())
+    def _on_installed_filter_changed(self):
+        self._prepared_filter = PreparedFilter(self.installed_search_edit.text().strip())
+        self.model.set_prepared_filter(self._prepared_filter)
         self._apply_advanced_filters()
 
     def refresh(self):
@@ -1078,36 +1625,45 @@ class MainWindow(QMainWindow):
             return
 
         self._is_loading = True
+        providers.invalidate_updates_cache()
+        _which_cached.cache_clear()
+        _aur_info_cache.clear()
+        _check_output_cached.cache_clear()
         self.btn_refresh.setEnabled(False)
         QApplication.setOverrideCursor(Qt.BusyCursor)
         self.loading_indicator.setFormat(tr("status_loading_packages"))
         self.loading_indicator.setVisible(True)
 
-        self._refresh_thread = RefreshThread(self)
-        self._refresh_thread.finished_with.connect(self._on_refresh_finished)
-        self._refresh_thread.finished.connect(self._on_refresh_thread_end)
-        self._refresh_thread.start()
+        self._refresh_requested.emit(self.model.snapshot())
 
-    @Slot(list)
-    def _on_refresh_finished(self, pkgs: List[PackageItem]):
-        self.model.set_items(pkgs)
-        self.console.feed_text(tr("msg_package_list_loading") + "\n")
-        self.console.feed_text(tr("msg_loaded", len(pkgs)) + "\n")
-        self._explicit_packages = None
-        self._dependency_packages = None
-        self._orphan_packages = None
-        self._update_status_info()
-        self._apply_advanced_filters()
+    @Slot(list, object)
+    def _on_refresh_finished(self, pkgs: List[PackageItem], delta):
+        # Repaint once after the update and the per-row hide pass, not per row.
+        self.table_installed.setUpdatesEnabled(False)
+        try:
+            if delta is None:
+                # Rows already arrived through batch_ready; only the order is left.
+                self.model.resort()
+            else:
+                self.model.apply_delta(*delta)
+            self.console.feed_text(tr("msg_package_list_loading") + "\n")
+            self.console.feed_text(tr("msg_loaded", len(pkgs)) + "\n")
+            self._explicit_packages = None
+            self._dependency_packages = None
+            self._orphan_packages = None
+            # Filled by list_flatpak() during this refresh; no extra subprocess here.
+            self._flatpak_scope_map = providers.get_flatpak_scopes()
+            self._update_status_info()
+            self._apply_advanced_filters()
+        finally:
+            self.table_installed.setUpdatesEnabled(True)
 
     @Slot()
-    def _on_refresh_thread_end(self):
+    def _on_refresh_worker_done(self):
         self._is_loading = False
         self.btn_refresh.setEnabled(True)
         QApplication.restoreOverrideCursor()
         self.loading_indicator.setVisible(False)
-        if self._refresh_thread:
-            self._refresh_thread.deleteLater()
-            self._refresh_thread = None
         self._report_provider_errors()
 
     def _report_provider_errors(self):
@@ -1318,31 +1874,26 @@ class MainWindow(QMainWindow):
         self.console.viewport().update()
         settings.set("terminal_font_size", new_size)
         settings.save()
+        self._font_sig = self._terminal_font_signature()
 
-    def _console_context_menu(self, event):
+    def _build_console_menu(self) -> QMenu:
         menu = QMenu(self.console)
-        act_copy = menu.addAction(tr("terminal_copy"))
-        act_paste = menu.addAction(tr("terminal_paste"))
-        act_reset = menu.addAction(tr("terminal_reset"))
+        menu.addAction(tr("terminal_copy")).triggered.connect(self.console.copy_selection)
+        menu.addAction(tr("terminal_paste")).triggered.connect(self.console.paste_from_clipboard)
+        menu.addAction(tr("terminal_reset")).triggered.connect(self.console.reset_terminal)
         menu.addSeparator()
-        act_inc = menu.addAction(tr("increase_font"))
-        act_dec = menu.addAction(tr("decrease_font"))
-        act_reset_font = menu.addAction(tr("reset_font"))
-
-        chosen = menu.exec(event.globalPos()) if event else None
-
-        if chosen == act_copy:
-            self.console.copy_selection()
-        elif chosen == act_paste:
-            self.console.paste_from_clipboard()
-        elif chosen == act_reset:
-            self.console.reset_terminal()
-        elif chosen == act_inc:
-            self._adjust_terminal_font(1)
-        elif chosen == act_dec:
-            self._adjust_terminal_font(-1)
-        elif chosen == act_reset_font:
-            self._reset_terminal_font()
+        menu.addAction(tr("increase_font")).triggered.connect(functools.partial(self._adjust_terminal_font, 1))
+        menu.addAction(tr("decrease_font")).triggered.connect(functools.partial(self._adjust_terminal_font, -1))
+        menu.addAction(tr("reset_font")).triggered.connect(self._reset_terminal_font)
+        return menu
+
+    def _console_context_menu(self, event):
+        if event is None:
+            return
+        # Built once and reused; _apply_settings() drops it so labels follow the language.
+        if self._console_menu is None:
+            self._console_menu = self._build_console_menu()
+        self._console_menu.exec(event.globalPos())
 
     def _ensure_notification_tray(self) -> Optional[QSystemTrayIcon]:
         if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -1350,7 +1901,7 @@ class MainWindow(QMainWindow):
         if self._notification_tray is None:
             icon = self.windowIcon()
             if icon.isNull():
-                icon = self.style().standardIcon(QStyle.SP_MessageBoxInformation)
+                icon = _fallback_icon()
             tray = QSystemTrayIcon(icon, self)
             tray.setVisible(True)
             self._notification_tray = tray
@@ -1380,8 +1931,8 @@ class MainWindow(QMainWindow):
         act_details = menu.addAction(tr("ctx_show_details"))
         act_un = menu.addAction(tr("ctx_uninstall_item", item.name))
 
-        act_details.triggered.connect(lambda: self._show_details_installed(item))
-        act_un.triggered.connect(lambda: self._confirm_uninstall(item))
+        act_details.triggered.connect(functools.partial(self._show_details_installed, item))
+        act_un.triggered.connect(functools.partial(self._confirm_uninstall, item))
 
         menu.exec(self.table_installed.viewport().mapToGlobal(pos))
 
@@ -1445,30 +1996,13 @@ class MainWindow(QMainWindow):
     def _detect_flatpak_scope(self, app_id: str) -> str:
         """Ermittle, ob ein Flatpak als --user oder --system installiert ist."""
 
-        try:
-            result = subprocess.run(
-                ["flatpak", "list", "--user", "--app", "--columns=application"],
-                text=True,
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0 and app_id in result.stdout:
-                return "user"
-        except Exception:
-            pass
-
-        try:
-            result = subprocess.run(
-                ["flatpak", "list", "--system", "--app", "--columns=application"],
-                text=True,
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0 and app_id in result.stdout:
-                return "system"
-        except Exception:
-            pass
-
+        scope = self._flatpak_scope_map.get(app_id)
+        if scope is None:
+            # Installed since the last refresh: re-read the exact per-scope ID sets.
+            self._flatpak_scope_map = providers.get_flatpak_scopes(force_refresh=True)
+            scope = self._flatpak_scope_map.get(app_id)
+        if scope:
+            return scope
         return settings.get("flatpak_default_scope", "user")
 
     def _on_search_clicked(self):
@@ -1481,238 +2015,51 @@ class MainWindow(QMainWindow):
         model = self.search_completer.model()
         if hasattr(model, "setStringList"):
             model.setStringList(self.search_history.get_all())
-        self.results.setRowCount(0)
-
-        if self.current_source == "Repo":
-            rows = self._search_pacman(term)
-            self._fill_results(rows)
-        elif self.current_source == "AUR":
-            rows = self._search_aur(term)
-            self._fill_results(rows)
-        elif self.current_source == "Flatpak":
-            rows = self._flatpak_search(term)
-            self._fill_results(rows)
-        else:
-            combined: List[Dict[str, str]] = []
-            combined.extend(self._search_pacman(term))
-            combined.extend(self._search_aur(term))
-            combined.extend(self._flatpak_search(term))
-            self._fill_results(combined)
+        self._results_model.clear()
 
-    def _fill_results(self, rows: List[Dict[str, str]]):
-        self.results.setSortingEnabled(False)
-
-        for r in rows:
-            row = self.results.rowCount()
-            self.results.insertRow(row)
-
-            source = (r.get("source") or "").strip() or self.current_source
-            if source in ("Repo", "AUR"):
-                data_id = r.get("name", "")
-                display = r.get("name", "")
-                version = r.get("version", "")
-                branch = r.get("repo", "")
-                remote = r.get("repo", "")
-                desc = r.get("description", "")
-            elif source == "Flatpak":
-                data_id = r.get("application", "")
-                name = r.get("name", "") or data_id
-                if name and name != data_id:
-                    display = f"{name} ({data_id})"
-                else:
-                    display = data_id
-                version = r.get("version", "")
-                branch = r.get("branch", "")
-                remote = r.get("remotes", "")
-                desc = r.get("description", "")
-            else:
-                data_id = r.get("name", "") or r.get("application", "")
-                display = data_id
-                version = r.get("version", "")
-                branch = r.get("branch", "") or r.get("repo", "")
-                remote = r.get("remotes", "") or r.get("repo", "")
-                desc = r.get("description", "")
-
-            cells = [
-                QTableWidgetItem(display),
-                QTableWidgetItem(version),
-                QTableWidgetItem(branch),
-                QTableWidgetItem(remote),
-                QTableWidgetItem(source),
-                QTableWidgetItem(desc),
-            ]
-            cells[0].setData(Qt.UserRole, r)
-            for col, cell in enumerate(cells):
-                self.results.setItem(row, col, cell)
-
-        self.results.setSortingEnabled(True)
-
-    def _search_pacman(self, term: str) -> List[Dict[str, str]]:
-        if not _which("pacman"):
-            return []
-        out = _check_output(["pacman", "-Ss", term])
-        rows: List[Dict[str, str]] = []
-        name = repo = version = desc = ""
-        for ln in out.splitlines():
-            if not ln.strip():
-                continue
-            m = re.match(r"^([a-z0-9\-+_.]+)/([^\s]+)\s+([^\s]+)\s*(.*)$", ln)
-            if m:
-                if name:
-                    rows.append({
-                        "name": name,
-                        "repo": repo,
-                        "version": version,
-                        "description": desc.strip(),
-                        "source": "Repo",
-                    })
-                repo, name, version, tail = m.groups()
-                desc = tail.strip()
-            else:
-                if ln.startswith(" "):
-                    desc += " " + ln.strip()
-        if name:
-            rows.append({
-                "name": name,
-                "repo": repo,
-                "version": version,
-                "description": desc.strip(),
-                "source": "Repo",
-            })
-        return rows
-
-    def _search_aur(self, term: str) -> List[Dict[str, str]]:
-        import os, subprocess, re
-
-        tool = settings.get_aur_helper()
-        if not tool:
+        if self.current_source in ("AUR", "Alle") and not settings.get_aur_helper():
             self.console.feed_text(tr("msg_no_aur_helper") + "\n")
             self.console.feed_text(tr("msg_aur_helper_tip") + "\n")
-            return []
 
-        env = os.environ.copy()
-        env["YAY_PAGER"] = "cat"
-        env["PAGER"] = "cat"
-        env["NO_COLOR"] = "1"
-        env["LC_ALL"] = env.get("LC_ALL", "C")
-        env["LANG"] = env.get("LANG", "C")
-
-        try:
-            out_names = subprocess.check_output(
-                [tool, "-Ssq", "--aur", term],
-                text=True, stderr=subprocess.DEVNULL, env=env
-            )
-        except Exception:
-            out_names = ""
-
-        names = [ln.strip() for ln in out_names.splitlines() if ln.strip()]
-        if not names:
-            try:
-                out_raw = subprocess.check_output([tool, "-Ss", term], text=True, stderr=subprocess.DEVNULL, env=env)
-            except Exception:
-                out_raw = ""
-            out_raw = re.sub(r"\x1b\[[0-9;]*m", "", out_raw)
-            for ln in out_raw.splitlines():
-                m = re.match(r"^aur/([^\s]+)\s", ln)
-                if m:
-                    names.append(m.group(1))
-            names = list(dict.fromkeys(names))
-
-        if not names:
-            return []
+        self.btn_search.setEnabled(False)
+        self._search_indicator_state = (
+            self.loading_indicator.isVisible(),
+            self.loading_indicator.format(),
+        )
+        self.loading_indicator.setFormat(tr("status_searching"))
+        self.loading_indicator.setVisible(True)
 
-        MAX_NAMES = 100
-        names = names[:MAX_NAMES]
+        self._search_thread = SearchThread(self, source=self.current_source, term=term)
+        self._search_thread.rows_ready.connect(self._fill_results)
+        self._search_thread.finished.connect(self._on_search_thread_finished)
+        self._search_thread.start()
 
-        rows: List[Dict[str, str]] = []
-        for chunk in self._split_chunks(names, 25):
-            try:
-                out_info = subprocess.check_output(
-                    [tool, "-Si", *chunk],
-                    text=True, stderr=subprocess.DEVNULL, env=env
-                )
-            except Exception:
-                continue
-            rows.extend(self._parse_yay_si(out_info))
+    @Slot(list)
+    def _fill_results(self, rows: List[ResultRow]):
+        # Backends report one after another; the model was cleared when the search started.
+        self._results_model.add_normalized_rows(rows)
 
-        for r in rows:
-            r.setdefault("repo", "aur")
-            r["repo"] = "aur"
-            r.setdefault("source", "AUR")
-        return rows
-
-    def _split_chunks(self, seq, n):
-        it = iter(seq)
-        while True:
-            chunk = list(itertools.islice(it, n))
-            if not chunk:
-                break
-            yield chunk
-
-    def _parse_yay_si(self, text: str) -> List[Dict[str, str]]:
-        import re
-        text = re.sub(r"\x1b\[[0-9;]*m", "", text)
-        blocks = re.split(r"\n{2,}", text.strip(), flags=re.M)
-
-        results: List[Dict[str, str]] = []
-        for blk in blocks:
-            name = version = desc = ""
-            for ln in blk.splitlines():
-                ln = ln.strip()
-                if not ln:
-                    continue
-                if re.match(r"^(Name|Package\s*name)\s*:", ln, re.I):
-                    name = ln.split(":", 1)[1].strip()
-                elif re.match(r"^(Version)\s*:", ln, re.I):
-                    version = ln.split(":", 1)[1].strip()
-                elif re.match(r"^(Beschreibung|Description)\s*:", ln, re.I):
-                    desc = ln.split(":", 1)[1].strip()
-            if name:
-                results.append({
-                    "name": name,
-                    "version": version,
-                    "description": desc,
-                    "repo": "aur",
-                    "source": "AUR",
-                })
-        return results
-
-    def _flatpak_search(self, term: str) -> List[Dict[str, str]]:
-        if not _which("flatpak"):
-            return []
-        try:
-            out = subprocess.check_output(
-                ["flatpak", "search", "--columns=application,name,description,branch,remotes,version", term],
-                text=True, stderr=subprocess.DEVNULL
-            )
-        except Exception:
-            out = ""
-        rows: List[Dict[str, str]] = []
-        for ln in out.splitlines():
-            parts = [p.strip() for p in ln.split("\t")]
-            if len(parts) < 6 or parts[0].lower() == "application":
-                continue
-            application, name, description, branch, remotes, version = parts[:6]
-            rows.append({
-                "application": application,
-                "name": name,
-                "description": description,
-                "branch": branch,
-                "remotes": remotes,
-                "version": version,
-                "source": "Flatpak",
-            })
-        return rows
+    @Slot()
+    def _on_search_thread_finished(self):
+        self.btn_search.setEnabled(True)
+        if self._search_thread:
+            self._search_thread.deleteLater()
+            self._search_thread = None
+        if self._search_indicator_state:
+            was_visible, fmt = self._search_indicator_state
+            self.loading_indicator.setFormat(fmt)
+            self.loading_indicator.setVisible(was_visible)
+            self._search_indicator_state = None
 
     def _show_details_installed(self, it: PackageItem):
         if it.source in ("Repo", "AUR"):
-            info = _check_output(["pacman", "-Qi", it.pid])
+            info = _check_output_cached(("pacman", "-Qi", it.pid))
             if not info:
                 tool = settings.get_aur_helper()
                 if tool:
-                    info = _check_output([tool, "-Qi", it.pid])
+                    info = _check_output_cached((tool, "-Qi", it.pid))
         elif it.source == "Flatpak":
-            info = _check_output(["flatpak", "info", it.pid])
+            info = _check_output_cached(("flatpak", "info", it.pid))
         else:
             info = ""
         if not info:
@@ -1723,27 +2070,27 @@ class MainWindow(QMainWindow):
         rows = [idx.row() for idx in self.results.selectionModel().selectedRows()]
         if not rows:
             return
-        rdict = self.results.item(rows[0], 0).data(Qt.UserRole) or {}
+        rdict = self._results_model.row_data(rows[0]) or {}
         source = (rdict.get("source") or self.current_source).strip()
         if source == "Flatpak":
             appid = (rdict.get("application") or "").strip()
-            info = _check_output(["flatpak", "info", appid]) if appid else ""
+            info = _check_output_cached(("flatpak", "info", appid)) if appid else ""
             title = tr("dialog_details_flatpak", appid or tr("unknown"))
         elif source == "Repo":
             name = (rdict.get("name") or "").strip()
-            info = _check_output(["pacman", "-Si", name]) if name else ""
+            info = _check_output_cached(("pacman", "-Si", name)) if name else ""
             title = tr("dialog_details_repo", name or tr("unknown"))
         elif source == "AUR":
             name = (rdict.get("name") or "").strip()
             tool = settings.get_aur_helper()
             if tool and name:
-                info = _check_output([tool, "-Si", name])
+                info = _check_output_cached((tool, "-Si", name))
             else:
                 info = tr("msg_aur_details_need_helper")
             title = tr("dialog_details_aur", name or tr("unknown"))
         else:
             name = (rdict.get("name") or "").strip()
-            info = _check_output(["pacman", "-Si", name]) if name else ""
+            info = _check_output_cached(("pacman", "-Si", name)) if name else ""
             title = tr("dialog_details_repo", name or tr("unknown"))
 
         if not info:
@@ -2054,17 +2401,17 @@ class MainWindow(QMainWindow):
             if QMessageBox.question(self, tr("dialog_confirm"), confirm_text) != QMessageBox.Yes:
                 return
 
-            cmds: List[Sequence[str] | Dict[str, object]] = []
+            cmds: List[Cmd] = []
 
             if selection["pacman"]:
-                cmds.append(["pacman", "-S", *selection["pacman"]])
+                cmds.append(Cmd(["pacman", "-S", *selection["pacman"]], needs_root=True))
 
             if selection["aur"]:
                 tool = settings.get_aur_helper()
                 if not tool:
                     QMessageBox.warning(self, tr("dialog_hint"), tr("msg_no_aur_helper_configured"))
                 else:
-                    cmds.append([tool, "-S", *selection["aur"]])
+                    cmds.append(Cmd([tool, "-S", *selection["aur"]]))
 
             if selection["flatpak"]:
                 rows = []
@@ -2080,7 +2427,7 @@ class MainWindow(QMainWindow):
                 for message, argv, needs_root in flatpak_cmds:
                     if message:
                         self.console.feed_text(message + "\n")
-                    cmds.append({"argv": argv, "needs_root": needs_root})
+                    cmds.append(Cmd(argv, needs_root))
 
             if not cmds:
                 QMessageBox.information(self, tr("dialog_hint"), tr("already_installed"))
@@ -2089,8 +2436,8 @@ class MainWindow(QMainWindow):
             dlg.accept()
             self._run_cmds_sequential(cmds)
 
-        btn_install_all.clicked.connect(lambda: _perform_install(True))
-        btn_install_sel.clicked.connect(lambda: _perform_install(False))
+        btn_install_all.clicked.connect(functools.partial(_perform_install, True))
+        btn_install_sel.clicked.connect(functools.partial(_perform_install, False))
 
         dlg.exec()
 
@@ -2103,7 +2450,7 @@ class MainWindow(QMainWindow):
         flatpak_rows: List[Dict[str, str]] = []
 
         for r in rows:
-            data = self.results.item(r, 0).data(Qt.UserRole) or {}
+            data = self._results_model.row_data(r) or {}
             source = (data.get("source") or self.current_source).strip()
             if source == "Repo":
                 nm = (data.get("name") or "").strip()
@@ -2116,7 +2463,7 @@ class MainWindow(QMainWindow):
             elif source == "Flatpak":
                 flatpak_rows.append(data)
 
-        commands: List[Sequence[str] | Dict[str, object]] = []
+        commands: List[Cmd] = []
 
         if flatpak_rows:
             flatpak_cmds = self._prepare_flatpak_install_commands(flatpak_rows)
@@ -2125,11 +2472,11 @@ class MainWindow(QMainWindow):
             for message, argv, needs_root in flatpak_cmds:
                 if message:
                     self.console.feed_text(message + "\n")
-                commands.append({"argv": argv, "needs_root": needs_root})
+                commands.append(Cmd(argv, needs_root))
 
         if repo_names:
             self.console.feed_text(tr("msg_installing_repo", ', '.join(repo_names)) + "\n")
-            commands.append(["pacman", "-S", *repo_names])
+            commands.append(Cmd(["pacman", "-S", *repo_names], needs_root=True))
 
         if aur_names:
             tool = settings.get_aur_helper()
@@ -2140,7 +2487,7 @@ class MainWindow(QMainWindow):
                 )
             else:
                 self.console.feed_text(tr("msg_installing_aur", tool, ', '.join(aur_names)) + "\n")
-                commands.append([tool, "-S", *aur_names])
+                commands.append(Cmd([tool, "-S", *aur_names]))
 
         if not commands:
             return
@@ -2153,55 +2500,40 @@ class MainWindow(QMainWindow):
             return
         added = 0
         for r in rows:
-            d = self.results.item(r, 0).data(Qt.UserRole) or {}
+            d = self._results_model.row_data(r) or {}
             source = (d.get("source") or self.current_source).strip()
             if source == "Flatpak":
                 appid = (d.get("application") or "").strip()
                 remotes = (d.get("remotes") or "").strip()
                 preferred_remote = remotes.split(",")[0].strip() if remotes else ""
                 if appid:
-                    self._queue_add(("Flatpak", appid, {"remote": preferred_remote}))
-                    added += 1
+                    if self._queue_add(("Flatpak", appid, {"remote": preferred_remote})):
+                        added += 1
             elif source == "Repo":
                 name = (d.get("name") or "").strip()
                 repo = (d.get("repo") or "").strip()
                 if name:
-                    self._queue_add(("Repo", name, {"repo": repo}))
-                    added += 1
+                    if self._queue_add(("Repo", name, {"repo": repo})):
+                        added += 1
             elif source == "AUR":
                 name = (d.get("name") or "").strip()
                 if name:
-                    self._queue_add(("AUR", name, {}))
-                    added += 1
+                    if self._queue_add(("AUR", name, {})):
+                        added += 1
         if added:
             self.console.feed_text(tr("msg_added_to_queue", added) + "\n")
 
-    def _queue_add(self, entry: Tuple[str, str, Dict[str, str]]):
-        self.install_queue.append(entry)
-        item = QListWidgetItem(self._queue_entry_label(entry))
-        item.setData(Qt.UserRole, entry)
-        icon = self.style().standardIcon(QStyle.SP_ArrowRight)
-        item.setIcon(icon)
-        self.queue_list.addItem(item)
-
-    def _queue_entry_label(self, entry: Tuple[str, str, Dict[str, str]]) -> str:
-        src, ident, meta = entry
-        if src == "Flatpak":
-            r = meta.get("remote") or ""
-            return f"[Flatpak] {ident}  ({r or 'auto'})"
-        elif src == "Repo":
-            return f"[Repo] {ident}"
-        else:
-            return f"[AUR] {ident}"
+    def _queue_add(self, entry: Tuple[str, str, Dict[str, str]]) -> bool:
+        return self.queue_model.add(entry)
 
     def _queue_install_all(self):
-        if not self.install_queue:
+        if not self.queue_model.rowCount():
             QMessageBox.information(self, tr("menu_queue"), tr("msg_queue_empty"))
             return
         flatpak_by_remote: Dict[str, List[str]] = {}
         repo_pkgs: List[str] = []
         aur_pkgs: List[str] = []
-        for src, ident, meta in self.install_queue:
+        for src, ident, meta in self.queue_model.entries():
             if src == "Flatpak":
                 remote = meta.get("remote") or ""
                 flatpak_by_remote.setdefault(remote, []).append(ident)
@@ -2233,19 +2565,13 @@ class MainWindow(QMainWindow):
         self._queue_clear()
 
     def _queue_clear(self):
-        self.install_queue.clear()
-        self.queue_list.clear()
+        self.queue_model.clear()
 
     def _queue_remove_selected(self):
-        items = self.queue_list.selectedItems()
-        if not items:
+        rows = [idx.row() for idx in self.queue_list.selectionModel().selectedIndexes()]
+        if not rows:
             return
-        for it in items:
-            entry = it.data(Qt.UserRole)
-            if entry in self.install_queue:
-                self.install_queue.remove(entry)
-            idx = self.queue_list.row(it)
-            self.queue_list.takeItem(idx)
+        self.queue_model.remove_rows(rows)
 
     def _prepare_flatpak_install_commands(self, selected_rows: List[Dict[str, str]]) -> Optional[List[Tuple[str, List[str], bool]]]:
         scopes = self._flatpak_list_remotes()
@@ -2282,49 +2608,41 @@ class MainWindow(QMainWindow):
             return None
 
         if need_user_add:
+            need_user_sorted = sorted(need_user_add)
             if QMessageBox.question(
                 self, tr("dialog_add_remote_as_user"),
-                tr("msg_remotes_system_only", ', '.join(sorted(need_user_add)))
+                tr("msg_remotes_system_only", ", ".join(need_user_sorted))
             ) == QMessageBox.Yes:
-                for r in sorted(need_user_add):
-                    if r == "flathub":
-                        self.console.feed_text("$ flatpak remote-add --if-not-exists --user flathub https://flathub.org/repo/flathub.flatpakrepo\n")
-                        ok_add = self._exec_quiet(["flatpak", "remote-add", "--if-not-exists", "--user",
-                                                   "flathub", "https://flathub.org/repo/flathub.flatpakrepo"])
-                        if ok_add:
-                            user_remotes.add("flathub")
-                        else:
-                            self.console.feed_text(tr("msg_could_not_add_flathub") + "\n")
-                            return None
-                    else:
-                        QMessageBox.information(
-                            self, tr("dialog_remote_url_needed"),
-                            tr("msg_remote_url_unknown", r)
-                        )
+                unknown = [r for r in need_user_sorted if r not in WELL_KNOWN_REMOTES]
+                known = [r for r in need_user_sorted if r in WELL_KNOWN_REMOTES]
+                failed = self._add_user_remotes(known)
+                if failed:
+                    self.console.feed_text(tr("msg_could_not_add_remote", ", ".join(failed)) + "\n")
+                    return None
+                user_remotes.update(known)
+                if unknown:
+                    QMessageBox.information(
+                        self, tr("dialog_remote_url_needed"),
+                        tr("msg_remote_url_unknown", ", ".join(unknown),
+                           "\n".join(f"flatpak remote-add --user {r} <URL>" for r in unknown))
+                    )
             else:
                 return None
 
+        scope_flag = f"--{default_scope}"
+        needs_root = default_scope == "system"
+        msg_key, msg_auto_key = _flatpak_install_message_keys(default_scope)
         commands: List[Tuple[str, List[str], bool]] = []
+        # Empty IDs were skipped while grouping, so every list here is non-empty.
         for remote, appids in to_install_by_remote.items():
-            appids = [a for a in appids if a]
-            if not appids:
-                continue
-            scope_flag = f"--{default_scope}"
-            needs_root = default_scope == "system"
             if remote:
                 if remote not in user_remotes and remote not in system_remotes:
                     self.console.feed_text(tr("msg_remote_unknown_skip", remote, ', '.join(appids)) + "\n")
                     continue
-                if default_scope == "user":
-                    message = tr("msg_installing_flatpak_user", remote, ', '.join(appids))
-                else:
-                    message = tr("msg_installing_flatpak_system", remote, ', '.join(appids))
+                message = tr(msg_key, remote, ', '.join(appids))
                 argv = ["flatpak", "install", scope_flag, "-y", remote, *appids]
             else:
-                if default_scope == "user":
-                    message = tr("msg_installing_flatpak_user_auto", ', '.join(appids))
-                else:
-                    message = tr("msg_installing_flatpak_system_auto", ', '.join(appids))
+                message = tr(msg_auto_key, ', '.join(appids))
                 argv = ["flatpak", "install", scope_flag, "-y", *appids]
             commands.append((message, argv, needs_root))
 
@@ -2337,66 +2655,84 @@ class MainWindow(QMainWindow):
         if not commands:
             return
 
-        seq: List[Dict[str, object]] = []
+        seq: List[Cmd] = []
         for message, argv, needs_root in commands:
             if message:
                 self.console.feed_text(message + "\n")
-            seq.append({"argv": argv, "needs_root": needs_root})
+            seq.append(Cmd(argv, needs_root))
 
         self._run_cmds_sequential(seq, final_message="")
 
     def _flatpak_install_grouped(self, grouped: Dict[str, List[str]]):
-        scopes = self._flatpak_list_remotes()
+        if not grouped:
+            return
+        # Without an explicit remote flatpak picks one itself; no need to list them.
+        if any(grouped):
+            scopes = self._flatpak_list_remotes()
+        else:
+            scopes = {"user": set(), "system": set()}
         user_remotes = scopes["user"]
         system_remotes = scopes["system"]
         default_scope = settings.get("flatpak_default_scope", "user")
 
-        commands: List[Dict[str, object]] = []
+        scope_flag = f"--{default_scope}"
+        needs_root = default_scope == "system"
+        msg_key, msg_auto_key = _flatpak_install_message_keys(default_scope)
+        commands: List[Cmd] = []
 
         for remote, appids in grouped.items():
-            appids = [a for a in appids if a]
-            if not appids:
-                continue
+            if not all(appids):
+                appids = [a for a in appids if a]
+                if not appids:
+                    continue
 
-            scope_flag = f"--{default_scope}"
-            needs_root = default_scope == "system"
             if remote:
                 if remote not in user_remotes and remote not in system_remotes:
                     self.console.feed_text(tr("msg_remote_unknown_skip", remote, ', '.join(appids)) + "\n")
                     continue
-                if default_scope == "user":
-                    self.console.feed_text(tr("msg_installing_flatpak_user", remote, ', '.join(appids)) + "\n")
-                else:
-                    self.console.feed_text(tr("msg_installing_flatpak_system", remote, ', '.join(appids)) + "\n")
+                self.console.feed_text(tr(msg_key, remote, ', '.join(appids)) + "\n")
                 argv = ["flatpak", "install", scope_flag, "-y", remote] + appids
-                commands.append({"argv": argv, "needs_root": needs_root})
+                commands.append(Cmd(argv, needs_root))
             else:
-                if default_scope == "user":
-                    self.console.feed_text(tr("msg_installing_flatpak_user_auto", ', '.join(appids)) + "\n")
-                else:
-                    self.console.feed_text(tr("msg_installing_flatpak_system_auto", ', '.join(appids)) + "\n")
+                self.console.feed_text(tr(msg_auto_key, ', '.join(appids)) + "\n")
                 argv = ["flatpak", "install", scope_flag, "-y"] + appids
-                commands.append({"argv": argv, "needs_root": needs_root})
+                commands.append(Cmd(argv, needs_root))
 
         if commands:
             self._run_cmds_sequential(commands, final_message="")
 
+    def _add_user_remotes(self, names: List[str]) -> List[str]:
+        """Add well-known remotes to the user installation; return the ones that failed."""
+
+        if not names:
+            return []
+        # All adds rewrite the same repo config, so they must not overlap.
+        for r in names:
+            argv = list(_remote_add_argv(r))
+            self.console.feed_text(f"$ {' '.join(argv)}\n")
+            if not self._exec_quiet(argv):
+                return [r]
+            self._invalidate_remotes_cache()
+        return []
+
     def _handle_flatpak_missing_remotes(self, missing_remotes: Set[str], user_remotes: Set[str],
                                         default_scope: str) -> bool:
         if not missing_remotes:
             return True
 
+        missing_str = ", ".join(sorted(missing_remotes))
+
         if default_scope == "system":
             QMessageBox.warning(
                 self, tr("dialog_remotes_missing"),
-                tr("msg_missing_remotes_setup", ", ".join(sorted(missing_remotes)))
+                tr("msg_missing_remotes_setup", missing_str)
             )
             return False
 
         if not settings.get("flatpak_auto_add_remotes", True):
             QMessageBox.warning(
                 self, tr("dialog_remotes_missing"),
-                tr("msg_missing_remotes_manual", ", ".join(sorted(missing_remotes)))
+                tr("msg_missing_remotes_manual", missing_str)
             )
             return False
 
@@ -2405,29 +2741,15 @@ class MainWindow(QMainWindow):
                 self, tr("dialog_remote_missing"),
                 tr("msg_flathub_not_configured")
             ) == QMessageBox.Yes:
-                self.console.feed_text("$ flatpak remote-add --if-not-exists --user flathub https://flathub.org/repo/flathub.flatpakrepo\n")
-                ok_add = self._exec_quiet(["flatpak", "remote-add", "--if-not-exists", "--user",
-                                           "flathub", "https://flathub.org/repo/flathub.flatpakrepo"])
+                self.console.feed_text(f"$ {FLATHUB_ADD_CMDLINE}\n")
+                ok_add = self._exec_quiet(list(FLATHUB_ADD_ARGV))
                 if ok_add:
-                    try:
-                        verify = subprocess.run(
-                            ["flatpak", "remotes", "--user", "--columns=name"],
-                            text=True,
-                            capture_output=True,
-                            check=False,
-                        )
-                    except FileNotFoundError:
-                        verify = None
-                    except Exception:
-                        verify = None
-
-                    if verify:
-                        names = [line.strip() for line in verify.stdout.splitlines() if line.strip()]
-                        if verify.returncode == 0 and "flathub" in names:
-                            self.console.feed_text(tr("msg_flathub_added") + "\n")
-                            user_remotes.add("flathub")
-                            missing_remotes.clear()
-                            return True
+                    self._invalidate_remotes_cache()
+                    if "flathub" in self._flatpak_list_remotes()["user"]:
+                        self.console.feed_text(tr("msg_flathub_added") + "\n")
+                        user_remotes.add("flathub")
+                        missing_remotes.clear()
+                        return True
 
                     self.console.feed_text(tr("msg_flathub_verify_failed") + "\n")
                     return False
@@ -2440,35 +2762,111 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(
                 self, tr("dialog_remotes_missing"),
-                tr("msg_missing_remotes_setup", ", ".join(sorted(missing_remotes)))
+                tr("msg_missing_remotes_setup", missing_str)
             )
             return False
 
     def _flatpak_list_remotes(self) -> dict:
-        return {
-            "user": self._flatpak_remotes_scope("--user"),
-            "system": self._flatpak_remotes_scope("--system"),
-        }
+        # Remotes rarely change; reuse the last listing while neither
+        # installation's repo config has been touched.
+        stamp = _flatpak_remote_config_stamp()
+        if self._remotes_prefetch is not None:
+            prefetch, self._remotes_prefetch = self._remotes_prefetch, None
+            # Blocks only if an install is requested before the prefetch is done.
+            prefetch_stamp, remotes = prefetch.result()
+            if prefetch_stamp == stamp:
+                self._remotes_cache = remotes
+                self._remotes_cache_mtime = stamp
+        if self._remotes_cache is None or self._remotes_cache_mtime != stamp:
+            self._remotes_cache = self._load_flatpak_remotes()
+            self._remotes_cache_mtime = stamp
+        # Callers add to these sets, so hand out copies.
+        return {scope: set(names) for scope, names in self._remotes_cache.items()}
+
+    def _prefetch_flatpak_remotes(self) -> None:
+        if self._remotes_prefetch is not None or not _which("flatpak"):
+            return
+        stamp = _flatpak_remote_config_stamp()
+        self._remotes_prefetch = _remote_pool.submit(
+            lambda: (stamp, self._load_flatpak_remotes())
+        )
+
+    def _load_flatpak_remotes(self) -> Dict[str, Set[str]]:
+        remotes = self._flatpak_remotes_combined() if self._remotes_combined_ok else None
+        if remotes is None:
+            self._remotes_combined_ok = False
+            # Both listings are dominated by flatpak start-up; run them side by side.
+            # The system one stays on this thread so a pooled caller can't starve the pool.
+            user = _remote_pool.submit(self._flatpak_remotes_scope, "--user")
+            system = self._flatpak_remotes_scope("--system")
+            remotes = {"user": user.result(), "system": system}
+        return remotes
+
+    def _invalidate_remotes_cache(self) -> None:
+        self._remotes_cache = None
+        self._remotes_cache_mtime = None
+        self._remotes_prefetch = None
+
+    def _flatpak_remotes_combined(self) -> Optional[Dict[str, Set[str]]]:
+        """List both installations' remotes with one call, classified by the options column.
+
+        Returns None when the output cannot be classified; callers then use
+        the per-scope listing.
+        """
+        argv = _resolve_argv(["flatpak", "remotes", "--columns=name,options"])
+        if argv is None:
+            return None
+        try:
+            result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        remotes: Dict[str, Set[str]] = {"user": set(), "system": set()}
+        for ln in result.stdout.decode("utf-8", "replace").splitlines():
+            name, _, options = ln.partition("\t")
+            name = name.strip()
+            if not name or name == "Name":
+                continue
+            opts = {opt.strip() for opt in options.split(",")}
+            if "user" in opts:
+                remotes["user"].add(name)
+            elif "system" in opts:
+                remotes["system"].add(name)
+            else:
+                return None
+        return remotes
 
     def _flatpak_remotes_scope(self, scope_flag: str) -> Set[str]:
+        argv = _resolve_argv(["flatpak", "remotes", scope_flag, "--columns=name"])
+        if argv is None:
+            return set()
         try:
-            out = subprocess.check_output(["flatpak", "remotes", scope_flag, "--columns=name"],
-                                          text=True, stderr=subprocess.DEVNULL)
+            result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         except Exception:
             return set()
-        names = {ln.strip() for ln in out.splitlines()
-                 if ln.strip() and not ln.lower().startswith("name")}
-        return names
+        if result.returncode != 0:
+            return set()
+        # Split on bytes and decode only the names, not the whole buffer.
+        lines = result.stdout.splitlines()
+        # Some flatpak versions print a "Name" header even with --columns.
+        start = 1 if lines and lines[0].strip() == b"Name" else 0
+        return {name.decode("utf-8", "replace") for ln in lines[start:] if (name := ln.strip())}
 
     def _exec_quiet(self, argv: List[str]) -> bool:
+        resolved = _resolve_argv(argv)
+        if resolved is None:
+            return False
         try:
-            subprocess.check_call(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.check_call(resolved, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except Exception:
             return False
 
 
-def main():
+def _parse_args() -> Tuple["argparse.Namespace", List[str]]:
+    import argparse
+
     parser = argparse.ArgumentParser(description="WrapPac")
     parser.add_argument(
         "--show-updates",
@@ -2485,7 +2883,18 @@ def main():
         action="store_true",
         help="Run the background update service and show a tray notification when updates are available.",
     )
-    args, qt_args = parser.parse_known_args()
+    return parser.parse_known_args()
+
+
+def main():
+    if len(sys.argv) > 1:
+        args, qt_args = _parse_args()
+    else:
+        # Plain launch: skip building the parser (and importing argparse) entirely.
+        args = SimpleNamespace(show_updates=False, tray_mode=False, run_update_service=False)
+        qt_args = []
+
+    i18n.preload()
 
     if args.run_update_service:
         sys.exit(_run_update_service(qt_args))
@@ -2504,7 +2913,7 @@ def main():
         return
 
     app.aboutToQuit.connect(server.close)
-    app.aboutToQuit.connect(lambda: QLocalServer.removeServer(SINGLE_INSTANCE_SERVER_NAME))
+    app.aboutToQuit.connect(functools.partial(QLocalServer.removeServer, SINGLE_INSTANCE_SERVER_NAME))
 
     icon = _load_app_icon()
     if icon:
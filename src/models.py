@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import itertools
 import re
-from typing import List
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from typing import Dict, Iterable, List, Set, Tuple
+from PySide6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex
 
 from i18n import tr
 
@@ -13,6 +14,68 @@ class PackageItem:
     source: str        # "Repo" | "AUR" | "Flatpak"
     origin: str        # Repository or remote (e.g. extra, community, local, flathub)
     size: str = ""
+    _search_blob: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self):
+        # Lowercased once at load time; the newline keeps matches from
+        # spanning the name/ID boundary.
+        self._search_blob = f"{self.name}\n{self.pid}".lower()
+
+
+PackageKey = Tuple[str, str]
+
+
+def package_key(item: PackageItem) -> PackageKey:
+    """Identity of a package across refreshes: (source, pid)."""
+    return (item.source, item.pid)
+
+
+def diff_packages(
+    previous: Dict[PackageKey, PackageItem],
+    items: List[PackageItem],
+) -> Tuple[List[PackageItem], List[PackageItem], List[PackageItem]]:
+    """Compare a snapshot with a fresh listing; return (added, removed, updated)."""
+    added: List[PackageItem] = []
+    updated: List[PackageItem] = []
+    seen = set()
+    for it in items:
+        key = package_key(it)
+        seen.add(key)
+        old = previous.get(key)
+        if old is None:
+            added.append(it)
+        elif old != it:
+            updated.append(it)
+    removed = [it for key, it in previous.items() if key not in seen]
+    return added, removed, updated
+
+
+class PreparedFilter:
+    """Installed-list search text, normalised once per change instead of per row.
+
+    Matching is a plain case-insensitive substring test. A regular expression
+    is only used when the text starts with "re:" and compiles.
+    """
+
+    __slots__ = ("text", "needle", "pattern")
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.needle = text.lower()
+        self.pattern = None
+        if self.needle.startswith("re:") and len(text) > 3:
+            try:
+                self.pattern = re.compile(text[3:], re.IGNORECASE)
+            except re.error:
+                self.pattern = None
+
+    def matches(self, item: PackageItem) -> bool:
+        if not self.needle:
+            return True
+        if self.pattern is not None:
+            return bool(self.pattern.search(item.name) or self.pattern.search(item.pid))
+        return self.needle in item._search_blob
+
 
 class PackageModel(QAbstractTableModel):
     headers = ["Name", "Version", "Size", "Quelle", "Origin/Repo", "ID"]
@@ -21,7 +84,7 @@ class PackageModel(QAbstractTableModel):
         super().__init__()
         self._all: List[PackageItem] = items or []
         self._filtered: List[PackageItem] = list(self._all)
-        self._text_filter = ""
+        self._prepared_filter = PreparedFilter()
         self._source_filter = "Alle"
         self._sort_column = 0
         self._sort_order = Qt.AscendingOrder
@@ -33,16 +96,87 @@ class PackageModel(QAbstractTableModel):
         self._apply_sort()
         self.endResetModel()
 
+    def append_items(self, items: List[PackageItem]):
+        """Append a batch with one row insertion; call resort() once all batches are in."""
+        self._all.extend(items)
+        accepts = self._accepts
+        accepted = [it for it in items if accepts(it)]
+        if not accepted:
+            return
+        first = len(self._filtered)
+        self.beginInsertRows(QModelIndex(), first, first + len(accepted) - 1)
+        self._filtered.extend(accepted)
+        self.endInsertRows()
+
+    def resort(self):
+        self.layoutAboutToBeChanged.emit()
+        self._apply_sort()
+        self.layoutChanged.emit()
+
+    def snapshot(self) -> Dict[PackageKey, PackageItem]:
+        """Return the current items keyed by package_key() (for diff_packages)."""
+        return {package_key(it): it for it in self._all}
+
+    def apply_delta(self, added: List[PackageItem], removed: List[PackageItem],
+                    updated: List[PackageItem]):
+        """Apply a refresh diff with targeted row signals instead of a full reset."""
+        if not (added or removed or updated):
+            return
+
+        removed_keys = {package_key(it) for it in removed}
+        replacements = {package_key(it): it for it in updated}
+
+        all_items: List[PackageItem] = []
+        for it in self._all:
+            key = package_key(it)
+            if key not in removed_keys:
+                all_items.append(replacements.get(key, it))
+        all_items.extend(added)
+        self._all = all_items
+
+        # Rows that disappear: removed packages and updates that no longer match.
+        drop_rows = []
+        for row, it in enumerate(self._filtered):
+            key = package_key(it)
+            if key in removed_keys:
+                drop_rows.append(row)
+            elif key in replacements:
+                new_item = replacements[key]
+                if self._accepts(new_item):
+                    self._filtered[row] = new_item
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+                else:
+                    drop_rows.append(row)
+        for row in reversed(drop_rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._filtered[row]
+            self.endRemoveRows()
+
+        visible = {package_key(it) for it in self._filtered}
+        new_rows = [
+            it for it in list(added) + list(replacements.values())
+            if package_key(it) not in visible and self._accepts(it)
+        ]
+        if new_rows:
+            first = len(self._filtered)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._filtered.extend(new_rows)
+            self.endInsertRows()
+
+        # Added rows and changed versions/sizes may move in the sort order.
+        if new_rows or replacements:
+            self.layoutAboutToBeChanged.emit()
+            self._apply_sort()
+            self.layoutChanged.emit()
+
+    def _accepts(self, it: PackageItem) -> bool:
+        if self._source_filter != "Alle" and it.source != self._source_filter:
+            return False
+        return self._prepared_filter.matches(it)
+
     def _apply_filters(self):
-        t = self._text_filter.lower()
-        src = self._source_filter
-        def ok(it: PackageItem) -> bool:
-            if src != "Alle" and it.source != src:
-                return False
-            if not t:
-                return True
-            return (t in it.name.lower()) or (t in it.pid.lower())
-        self._filtered = [it for it in self._all if ok(it)]
+        accepts = self._accepts
+        self._filtered = [it for it in self._all if accepts(it)]
 
     def _apply_sort(self):
         """Sort the filtered list according to the selected column."""
@@ -73,7 +207,10 @@ class PackageModel(QAbstractTableModel):
         self._filtered.sort(key=_sort_key, reverse=reverse)
 
     def set_text_filter(self, text: str):
-        self._text_filter = text
+        self.set_prepared_filter(PreparedFilter(text))
+
+    def set_prepared_filter(self, prepared: PreparedFilter):
+        self._prepared_filter = prepared
         self.beginResetModel()
         self._apply_filters()
         self._apply_sort()
@@ -174,3 +311,224 @@ class PackageModel(QAbstractTableModel):
         }
         multiplier = factors.get(unit, 1)
         return value * multiplier
+
+
+QueueEntry = Tuple[str, str, Dict[str, str]]  # (source, ident, meta)
+
+
+class QueueModel(QAbstractListModel):
+    """Install queue backing the queue list view."""
+
+    def __init__(self, icon=None):
+        super().__init__()
+        self._entries: List[QueueEntry] = []
+        self._keys: Set[PackageKey] = set()
+        self._icon = icon
+
+    @staticmethod
+    def label(entry: QueueEntry) -> str:
+        src, ident, meta = entry
+        if src == "Flatpak":
+            r = meta.get("remote") or ""
+            return f"[Flatpak] {ident}  ({r or 'auto'})"
+        elif src == "Repo":
+            return f"[Repo] {ident}"
+        else:
+            return f"[AUR] {ident}"
+
+    def add(self, entry: QueueEntry) -> bool:
+        """Append entry unless the same (source, ident) is already queued."""
+        key = (entry[0], entry[1])
+        if key in self._keys:
+            return False
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self._keys.add(key)
+        self.endInsertRows()
+        return True
+
+    def remove_rows(self, rows: Iterable[int]):
+        valid = sorted({r for r in rows if 0 <= r < len(self._entries)}, reverse=True)
+        # Remove contiguous runs in one step each, bottom-up so indices stay valid.
+        for _, run in itertools.groupby(enumerate(valid), lambda pair: pair[0] + pair[1]):
+            run_rows = [row for _, row in run]
+            first, last = run_rows[-1], run_rows[0]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for src, ident, _meta in self._entries[first:last + 1]:
+                self._keys.discard((src, ident))
+            del self._entries[first:last + 1]
+            self.endRemoveRows()
+
+    def clear(self):
+        if not self._entries:
+            return
+        self.beginResetModel()
+        self._entries.clear()
+        self._keys.clear()
+        self.endResetModel()
+
+    def entries(self) -> List[QueueEntry]:
+        return list(self._entries)
+
+    # Qt model impl
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return self.label(entry)
+        if role == Qt.DecorationRole:
+            return self._icon
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+
+_VERSION_TOKEN_RE = re.compile(r"\d+|[a-zA-Z]+")
+
+
+def version_sort_key(version: str) -> Tuple:
+    """Approximate pacman's vercmp ordering: epoch first, numeric runs compared as numbers."""
+    epoch, sep, rest = version.partition(":")
+    if not sep or not epoch.isdigit():
+        epoch, rest = "0", version
+    # Letters sort before the end of the string, which sorts before digits,
+    # so 1.0a < 1.0 < 1.0.1 as with vercmp.
+    tokens = tuple(
+        (2, int(tok), "") if tok.isdigit() else (0, 0, tok.lower())
+        for tok in _VERSION_TOKEN_RE.findall(rest)
+    ) + ((1, 0, ""),)
+    return (int(epoch), tokens)
+
+
+# (display, version, branch, remote, source, description, raw result dict)
+ResultRow = Tuple[str, str, str, str, str, str, Dict[str, str]]
+
+
+def _norm_pacman(r: Dict[str, str], source: str) -> ResultRow:
+    repo = r.get("repo", "")
+    return (r.get("name", ""), r.get("version", ""), repo, repo, source, r.get("description", ""), r)
+
+
+def _norm_flatpak(r: Dict[str, str], source: str) -> ResultRow:
+    data_id = r.get("application", "")
+    name = r.get("name", "") or data_id
+    display = f"{name} ({data_id})" if name and name != data_id else data_id
+    return (display, r.get("version", ""), r.get("branch", ""), r.get("remotes", ""),
+            source, r.get("description", ""), r)
+
+
+def _norm_generic(r: Dict[str, str], source: str) -> ResultRow:
+    return (
+        r.get("name", "") or r.get("application", ""),
+        r.get("version", ""),
+        r.get("branch", "") or r.get("repo", ""),
+        r.get("remotes", "") or r.get("repo", ""),
+        source,
+        r.get("description", ""),
+        r,
+    )
+
+
+_RESULT_NORMALIZERS = {"Repo": _norm_pacman, "AUR": _norm_pacman, "Flatpak": _norm_flatpak}
+
+
+def normalize_result_row(r: Dict[str, str], default_source: str) -> ResultRow:
+    """Pick the displayed fields of a search hit once, based on its source."""
+    source = (r.get("source") or "").strip() or default_source
+    return _RESULT_NORMALIZERS.get(source, _norm_generic)(r, source)
+
+
+class ResultsModel(QAbstractTableModel):
+    """Search results stored as normalized ResultRow tuples."""
+
+    columns = ("display", "version", "branch", "remote", "source", "description")
+
+    def __init__(self):
+        super().__init__()
+        self._rows: List[ResultRow] = []
+        self._sort_column: int | None = None
+        self._sort_order = Qt.AscendingOrder
+
+    def set_normalized_rows(self, rows: List[ResultRow]):
+        self.beginResetModel()
+        self._rows = rows
+        self._apply_sort()
+        self.endResetModel()
+
+    def add_normalized_rows(self, rows: List[ResultRow]):
+        """Add rows to the current results, keeping the active sort order."""
+        if not rows:
+            return
+        if self._sort_column is None or not self._rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self._apply_sort()
+            self.endInsertRows()
+            return
+        self.set_normalized_rows(self._rows + rows)
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def row_data(self, row: int) -> Dict[str, str]:
+        return self._rows[row][6]
+
+    def _apply_sort(self):
+        if self._sort_column is None or not self._rows:
+            return
+        col = self._sort_column
+        if col == 1:
+            key = lambda entry: version_sort_key(entry[1])
+        else:
+            key = lambda entry: entry[col].lower()
+        self._rows.sort(key=key, reverse=(self._sort_order == Qt.DescendingOrder))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Implement sorting support for QTableView."""
+        if column < 0 or column >= len(self.columns):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_sort()
+        self.layoutChanged.emit()
+
+    # Qt model impl
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return entry[index.column()]
+        if role == Qt.UserRole and index.column() == 0:
+            return entry[6]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            labels = [
+                tr("table_package"),
+                tr("table_version"),
+                tr("table_branch_repo"),
+                tr("table_remote_source"),
+                tr("table_source"),
+                tr("table_description"),
+            ]
+            if 0 <= section < len(labels):
+                return labels[section]
+        return None
@@ -1,15 +1,22 @@
+import asyncio
+import json
 import os
 import re
 import shutil
 import subprocess
 import shlex
-from typing import Dict, Iterable, List, Optional, Set
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
 from models import PackageItem
 from settings import settings
 
 _run_errors: list[dict[str, str]] = []
 
+UPDATES_CACHE_FILE = Path.home() / ".cache" / "wrappac" / "updates.json"
+UPDATES_CACHE_TTL = 300  # seconds
+
 
 def _format_cmd(cmd: list[str]) -> str:
     try:
@@ -97,6 +104,41 @@ def _run(cmd: list[str]) -> str:
     return out
 
 
+async def _run_with_code_async(
+    cmd: list[str],
+    ignore_exit_codes: Iterable[int] = (),
+    timeout: Optional[float] = None,
+) -> tuple[str, int]:
+    """Async counterpart of _run_with_code built on asyncio subprocesses."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        _record_error(cmd, "not-found")
+        return "", -1
+    except Exception as exc:
+        _record_error(cmd, f"exception: {exc}")
+        return "", -1
+
+    try:
+        raw_out, raw_err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        _record_error(cmd, "timeout")
+        return "", -1
+
+    stdout = raw_out.decode("utf-8", errors="replace")
+    stderr = raw_err.decode("utf-8", errors="replace")
+    if proc.returncode != 0 and proc.returncode not in ignore_exit_codes:
+        details = stderr.strip() or stdout.strip()
+        _record_error(cmd, f"exit-code {proc.returncode}", details)
+    return stdout, proc.returncode
+
+
 def _which_or_hint(cmd: str) -> bool:
     """Return True if an executable command is available."""
     return shutil.which(cmd) is not None
@@ -104,7 +146,14 @@ def _parse_pacman_query_output(out: str) -> list[tuple[str, str, Optional[str]]]
     """Parses formatted pacman -Q output lines into name/version/repo tuples."""
 
     entries: list[tuple[str, str, Optional[str]]] = []
+    append = entries.append
     for raw in out.splitlines():
+        # Fast path: the --format output is exactly "name\tversion\trepo".
+        parts = raw.split("\t")
+        if len(parts) == 3 and parts[0] and parts[1]:
+            append((parts[0], parts[1], parts[2] or None))
+            continue
+
         line = raw.strip()
         if not line:
             continue
@@ -125,7 +174,7 @@ def _parse_pacman_query_output(out: str) -> list[tuple[str, str, Optional[str]]]
         version = version.strip()
         cleaned_repo = repo.strip() if isinstance(repo, str) else repo
 
-        entries.append((name, version, cleaned_repo))
+        append((name, version, cleaned_repo))
 
     return entries
 
@@ -188,18 +237,22 @@ def list_pacman_foreign() -> List[PackageItem]:
 
 
 def list_flatpak() -> List[PackageItem]:
-    """Flatpak apps via flatpak list --app --columns=application,name,branch,origin."""
+    """Flatpak apps via flatpak list --app --columns=application,name,branch,origin,size."""
     if not _which_or_hint("flatpak"):
         return []
-    out = _run(["flatpak", "list", "--app", "--columns=application,name,branch,origin"])
+    scopes = get_flatpak_scopes(force_refresh=True)
+    # The size column saves one `flatpak info` process per installed app.
+    out = _run(["flatpak", "list", "--app", "--columns=application,name,branch,origin,size"])
     items: List[PackageItem] = []
     for line in out.splitlines():
         parts = line.split("\t")
+        size = parts[4].strip() if len(parts) >= 5 else ""
         if len(parts) < 4:
             parts = line.split()  # Fallback if the tab separator is missing
         if len(parts) >= 4:
             appid, dispname, branch, origin = [p.strip() for p in parts[:4]]
-            size = get_flatpak_size(appid)
+            if not size:
+                size = get_flatpak_size(appid, scopes.get(appid))
             items.append(
                 PackageItem(
                     pid=appid,
@@ -213,38 +266,53 @@ def list_flatpak() -> List[PackageItem]:
     return items
 
 
-def get_flatpak_size(app_id: str) -> str:
-    """Extract the installed size for a Flatpak application."""
+_flatpak_scope_cache: Optional[Dict[str, str]] = None
 
-    try:
+
+def get_flatpak_scopes(force_refresh: bool = False) -> Dict[str, str]:
+    """Map installed Flatpak app IDs to "user" or "system" using one list call per scope."""
+
+    global _flatpak_scope_cache
+    if not force_refresh and _flatpak_scope_cache is not None:
+        return _flatpak_scope_cache
+
+    scopes: Dict[str, str] = {}
+    if shutil.which("flatpak"):
         env = os.environ.copy()
         env["LC_ALL"] = "C"
+        # User installations take precedence, as flatpak itself prefers them.
+        for scope in ("user", "system"):
+            try:
+                out = subprocess.check_output(
+                    ["flatpak", "list", f"--{scope}", "--app", "--columns=application"],
+                    text=True,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                )
+            except Exception:
+                continue
+            for line in out.splitlines():
+                app_id = line.strip()
+                if app_id:
+                    scopes.setdefault(app_id, scope)
 
-        scope: Optional[str] = None
+    _flatpak_scope_cache = scopes
+    return scopes
 
-        user_cmd = ["flatpak", "list", "--user", "--app", "--columns=application"]
-        user_out = subprocess.check_output(
-            user_cmd,
-            text=True,
-            stderr=subprocess.DEVNULL,
-            env=env,
-        )
-        if any(line.strip() == app_id for line in user_out.splitlines()):
-            scope = "--user"
-        else:
-            system_cmd = ["flatpak", "list", "--system", "--app", "--columns=application"]
-            system_out = subprocess.check_output(
-                system_cmd,
-                text=True,
-                stderr=subprocess.DEVNULL,
-                env=env,
-            )
-            if any(line.strip() == app_id for line in system_out.splitlines()):
-                scope = "--system"
+
+def get_flatpak_size(app_id: str, scope: Optional[str] = None) -> str:
+    """Extract the installed size for a Flatpak application."""
+
+    if scope is None:
+        scope = get_flatpak_scopes().get(app_id)
+
+    try:
+        env = os.environ.copy()
+        env["LC_ALL"] = "C"
 
         info_cmd = ["flatpak", "info"]
         if scope is not None:
-            info_cmd.append(scope)
+            info_cmd.append(f"--{scope}")
         info_cmd.append(app_id)
 
         out = subprocess.check_output(
@@ -264,9 +332,16 @@ def get_flatpak_size(app_id: str) -> str:
     return ""
 
 
+def iter_all() -> Iterator[List[PackageItem]]:
+    """Yield the Repo, AUR, and Flatpak package lists one source at a time."""
+    yield list_pacman_native()
+    yield list_pacman_foreign()
+    yield list_flatpak()
+
+
 def list_all() -> List[PackageItem]:
     """Return the combined list of Repo, AUR, and Flatpak packages."""
-    return list_pacman_native() + list_pacman_foreign() + list_flatpak()
+    return [item for part in iter_all() for item in part]
 
 
 def get_explicit_packages() -> Set[str]:
@@ -290,30 +365,34 @@ def get_orphaned_packages() -> Set[str]:
     return {line.strip() for line in out.splitlines() if line.strip()}
 
 
-def updates_pacman_count() -> int:
+def _count_lines(out: str) -> int:
+    return sum(1 for ln in out.splitlines() if ln.strip())
+
+
+async def updates_pacman_count_async() -> int:
     """Return the number of updates available in the official repositories."""
-    out, code = _run_with_code(["checkupdates"], ignore_exit_codes=(2,))
+    out, code = await _run_with_code_async(["checkupdates"], ignore_exit_codes=(2,))
     if code in (0, 2):
-        return sum(1 for ln in out.splitlines() if ln.strip())
+        return _count_lines(out)
     return 0
 
 
-def updates_aur_count() -> int:
+async def updates_aur_count_async() -> int:
     """Return the number of available AUR updates (yay -Qua)."""
     tool = settings.get_aur_helper()
     if not tool:
         return 0
 
-    out, code = _run_with_code([tool, "-Qua"], ignore_exit_codes=(1,))
+    out, code = await _run_with_code_async([tool, "-Qua"], ignore_exit_codes=(1,))
     # Exit code 0 = updates available
     # Exit code 1 = no updates (normal for yay!)
     if code in (0, 1):
-        return sum(1 for ln in out.splitlines() if ln.strip())
+        return _count_lines(out)
 
     return 0
 
 
-def updates_flatpak_count() -> int:
+async def updates_flatpak_count_async() -> int:
     """Return the number of Flatpak updates (apps and runtimes).
 
     Both user and system installations are queried explicitly to avoid relying
@@ -325,7 +404,7 @@ def updates_flatpak_count() -> int:
     if not _which_or_hint("flatpak"):
         return 0
 
-    def _count_scope(scope: str) -> int:
+    async def _count_scope(scope: str) -> int:
         cmd = [
             "flatpak",
             "remote-ls",
@@ -333,41 +412,76 @@ def updates_flatpak_count() -> int:
             scope,
             "--columns=ref",
         ]
-        try:
-            proc = subprocess.run(
-                cmd,
-                text=True,
-                capture_output=True,
-                check=False,
-                timeout=30,
-            )
-        except subprocess.TimeoutExpired:
-            _record_error(cmd, "timeout")
-            return 0
-        except Exception as exc:
-            _record_error(cmd, f"exception: {exc}")
+        out, code = await _run_with_code_async(cmd, timeout=30)
+        if code != 0:
             return 0
 
-        if proc.returncode != 0:
-            _record_error(cmd, f"exit-code {proc.returncode}", proc.stderr)
-            return 0
-
-        lines = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
+        lines = [line.strip() for line in out.splitlines() if line.strip()]
         if lines and lines[0].lower() == "ref":
             lines = lines[1:]
 
         return len(lines)
 
-    user_count = _count_scope("--user")
-    system_count = _count_scope("--system")
+    user_count, system_count = await asyncio.gather(
+        _count_scope("--user"),
+        _count_scope("--system"),
+    )
     return user_count + system_count
 
 
+async def _updates_counts_async() -> tuple[int, int, int]:
+    results = await asyncio.gather(
+        updates_pacman_count_async(),
+        updates_aur_count_async(),
+        updates_flatpak_count_async(),
+        return_exceptions=True,
+    )
+    # A failing provider only zeroes its own count.
+    pac, aur, flp = (r if isinstance(r, int) else 0 for r in results)
+    return pac, aur, flp
+
+
+def updates_counts() -> tuple[int, int, int]:
+    """Return (pacman, AUR, Flatpak) update counts, probed concurrently."""
+    return asyncio.run(_updates_counts_async())
+
+
+def load_cached_updates_counts(ttl: float = UPDATES_CACHE_TTL) -> Optional[tuple[int, int, int]]:
+    """Return the cached (pacman, AUR, Flatpak) counts if younger than ttl seconds."""
+    try:
+        with open(UPDATES_CACHE_FILE, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if time.time() - float(data["ts"]) >= ttl:
+            return None
+        return int(data["pac"]), int(data["aur"]), int(data["flp"])
+    except Exception:
+        return None
+
+
+def store_updates_counts(pac: int, aur: int, flp: int) -> None:
+    """Persist update counts for later update-service runs."""
+    try:
+        UPDATES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(UPDATES_CACHE_FILE, "w", encoding="utf-8") as fh:
+            json.dump({"ts": time.time(), "pac": pac, "aur": aur, "flp": flp}, fh)
+    except Exception:
+        pass
+
+
+def invalidate_updates_cache() -> None:
+    """Forget cached update counts (after installs, updates, or a manual refresh)."""
+    try:
+        UPDATES_CACHE_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def is_reflector_available() -> bool:
     return _which_or_hint("reflector")
 
 
-def build_reflector_command(args: Optional[str] = None) -> Optional[dict[str, object]]:
+def build_reflector_command(args: Optional[str] = None) -> Optional[List[str]]:
+    """Return the reflector argv; it always has to run as root."""
     if not is_reflector_available():
         _record_error(["reflector"], "not-found")
         return None
@@ -396,6 +510,4 @@ def build_reflector_command(args: Optional[str] = None) -> Optional[dict[str, ob
     if not protocols_specified and shutil.which("rsync") is None:
         extra.extend(["--protocol", "https"])
 
-    cmd = ["reflector", *extra]
-
-    return {"argv": cmd, "needs_root": True}
+    return ["reflector", *extra]
@@ -424,11 +424,39 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
         self._autostart = shell
         self._was_at_bottom = True  # Track if user was scrolled to bottom
 
+        # feed_text() calls are batched and rendered once per event-loop pass
+        self._pending: List[str] = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        # Built on the first right-click and reused afterwards
+        self._context_menu: Optional[QtWidgets.QMenu] = None
+
+        # PTY output is parsed as it arrives, but the view is refreshed at most once per frame
+        self._view_timer = QtCore.QTimer(self)
+        self._view_timer.setSingleShot(True)
+        self._view_timer.setInterval(16)
+        self._view_timer.timeout.connect(self._update_scrollbar_and_view)
+
         if self._manage_pty and self._autostart is not None:
             self.start_process(self._autostart)
 
     def feed_text(self, text: str):
         """External feed for text rendering (when start_pty=False)."""
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_pending(self):
+        """Render all text queued by feed_text() in a single pass."""
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._flush_timer.stop()
         self.parser.feed(text.encode("utf-8", errors="replace"))
         self._update_scrollbar_and_view()
 
@@ -486,7 +514,7 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
 
     def run_line(self, line: str):
         """Send a complete line (with CR) to the child process."""
-        self.write_pty((line + "\r").encode("utf-8", errors="ignore"))
+        self.write_pty(line.encode("utf-8", errors="ignore") + b"\r")
 
     def closeEvent(self, e: QtGui.QCloseEvent) -> None:
         try:
@@ -512,6 +540,9 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
         if self.master_fd is None:
             return
 
+        # Keep queued status text ahead of the child's output
+        self._flush_pending()
+
         # Remember if we were at bottom before new data arrives
         self._was_at_bottom = self._is_scrolled_to_bottom()
 
@@ -526,7 +557,8 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
         except OSError:
             pass
 
-        self._update_scrollbar_and_view()
+        if not self._view_timer.isActive():
+            self._view_timer.start()
 
     def write_pty(self, data: bytes):
         if self.master_fd is None:
@@ -542,8 +574,8 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
 
     def _update_scrollbar_and_view(self):
         """Update scrollbar range and auto-scroll if needed."""
-        full_lines = list(self.screen.scrollback) + self.screen.primary
-        total_lines = len(full_lines)
+        self._view_timer.stop()
+        total_lines = len(self.screen.scrollback) + len(self.screen.primary)
         max_scroll = max(0, total_lines - self.rows)
 
         # Update range
@@ -768,17 +800,15 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
         super().mouseReleaseEvent(e)
 
     def contextMenuEvent(self, e: QtGui.QContextMenuEvent) -> None:
-        menu = QtWidgets.QMenu(self)
-        act_copy = menu.addAction("Copy")
-        act_paste = menu.addAction("Paste")
-        act_reset = menu.addAction("Reset Terminal")
-        chosen = menu.exec_(e.globalPos())
-        if chosen == act_copy:
-            self.copy_selection()
-        elif chosen == act_paste:
-            self.paste_from_clipboard()
-        elif chosen == act_reset:
-            self.reset_terminal()
+        if self._context_menu is None:
+            menu = QtWidgets.QMenu(self)
+            self._act_copy = menu.addAction("Copy")
+            self._act_copy.triggered.connect(self.copy_selection)
+            menu.addAction("Paste").triggered.connect(self.paste_from_clipboard)
+            menu.addAction("Reset Terminal").triggered.connect(self.reset_terminal)
+            self._context_menu = menu
+        self._act_copy.setEnabled(bool(self.sel_start and self.sel_end))
+        self._context_menu.exec_(e.globalPos())
 
     def copy_selection(self):
         if not (self.sel_start and self.sel_end):
@@ -803,6 +833,8 @@ class TerminalWidget(QtWidgets.QAbstractScrollArea):
         self.write_pty(text.encode('utf-8'))
 
     def reset_terminal(self):
+        self._pending.clear()
+        self._flush_timer.stop()
         self.screen.reset()
         self.parser = AnsiParser(self.screen)
         self._update_scrollbar_and_view()
@@ -17,7 +17,17 @@ from PySide6.QtCore import Qt, QTime
 
 from settings import settings
 import update_service
-from i18n import tr
+from i18n import tr, set_locale
+
+
+def _clear_layout(layout) -> None:
+    """Remove and delete every widget in a layout."""
+    while layout.count():
+        item = layout.takeAt(0)
+        widget = item.widget()
+        if widget is not None:
+            widget.hide()
+            widget.deleteLater()
 
 
 class FlatpakRemoteDialog(QDialog):
@@ -152,28 +162,37 @@ class SettingsDialog(QDialog):
         status_label = QLabel(f"<b>{tr('settings_aur_detected')}:</b>")
         layout.addWidget(status_label)
 
+        self.aur_detected_layout = QVBoxLayout()
+        layout.addLayout(self.aur_detected_layout)
+        self._fill_aur_detected()
+
+        layout.addStretch()
+        return widget
+
+    def _fill_aur_detected(self):
+        """(Re)list the AUR helpers found in PATH."""
+        _clear_layout(self.aur_detected_layout)
+
         detected = []
         for cmd in ["yay", "paru", "pikaur"]:
-            if shutil.which(cmd):
-                detected.append(f"✓ {cmd} ({shutil.which(cmd)})")
+            path = shutil.which(cmd)
+            if path:
+                detected.append(f"✓ {cmd} ({path})")
 
         if detected:
             for d in detected:
                 lbl = QLabel(d)
                 lbl.setStyleSheet("color: green; margin-left: 20px;")
-                layout.addWidget(lbl)
+                self.aur_detected_layout.addWidget(lbl)
         else:
             lbl = QLabel(tr("settings_aur_none_found"))
             lbl.setStyleSheet("color: #cc6600; margin-left: 20px;")
-            layout.addWidget(lbl)
+            self.aur_detected_layout.addWidget(lbl)
 
             hint = QLabel(tr("settings_aur_install_tip"))
             hint.setWordWrap(True)
             hint.setStyleSheet("color: gray; font-size: 9pt; margin: 10px 20px;")
-            layout.addWidget(hint)
-
-        layout.addStretch()
-        return widget
+            self.aur_detected_layout.addWidget(hint)
 
     # ===== TAB 2: Root method =====
     def _build_root_tab(self) -> QWidget:
@@ -200,14 +219,9 @@ class SettingsDialog(QDialog):
         status_label = QLabel(f"<b>{tr('settings_root_available')}:</b>")
         layout.addWidget(status_label)
 
-        for cmd, desc in [("sudo", "sudo"), ("doas", "doas")]:
-            if shutil.which(cmd):
-                lbl = QLabel(f"✓ {desc} ({shutil.which(cmd)})")
-                lbl.setStyleSheet("color: green; margin-left: 20px;")
-            else:
-                lbl = QLabel(tr("settings_root_not_installed", desc))
-                lbl.setStyleSheet("color: gray; margin-left: 20px;")
-            layout.addWidget(lbl)
+        self.root_detected_layout = QVBoxLayout()
+        layout.addLayout(self.root_detected_layout)
+        self._fill_root_detected()
 
         # Security notice – now styled as warning
         layout.addSpacing(20)
@@ -302,6 +316,20 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
 
+    def _fill_root_detected(self):
+        """(Re)list which root tools are installed."""
+        _clear_layout(self.root_detected_layout)
+
+        for cmd, desc in [("sudo", "sudo"), ("doas", "doas")]:
+            path = shutil.which(cmd)
+            if path:
+                lbl = QLabel(f"✓ {desc} ({path})")
+                lbl.setStyleSheet("color: green; margin-left: 20px;")
+            else:
+                lbl = QLabel(tr("settings_root_not_installed", desc))
+                lbl.setStyleSheet("color: gray; margin-left: 20px;")
+            self.root_detected_layout.addWidget(lbl)
+
     # ===== TAB 5: Reflector =====
     def _build_reflector_tab(self) -> QWidget:
         widget = QWidget()
@@ -312,12 +340,9 @@ class SettingsDialog(QDialog):
         info.setStyleSheet("color: gray; margin-bottom: 10px;")
         layout.addWidget(info)
 
-        available = shutil.which("reflector") is not None
-        status = QLabel(
-            tr("settings_reflector_available") if available else tr("settings_reflector_missing")
-        )
-        status.setStyleSheet("color: green;" if available else "color: #cc6600;")
-        layout.addWidget(status)
+        self.reflector_status = QLabel()
+        self._update_reflector_status()
+        layout.addWidget(self.reflector_status)
 
         self.reflector_config_group = QGroupBox(tr("settings_reflector_command_group"))
         config_layout = QFormLayout()
@@ -350,6 +375,13 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
 
+    def _update_reflector_status(self):
+        available = shutil.which("reflector") is not None
+        self.reflector_status.setText(
+            tr("settings_reflector_available") if available else tr("settings_reflector_missing")
+        )
+        self.reflector_status.setStyleSheet("color: green;" if available else "color: #cc6600;")
+
     # ===== TAB 6: Flatpak =====
     def _build_flatpak_tab(self) -> QWidget:
         widget = QWidget()
@@ -675,6 +707,14 @@ class SettingsDialog(QDialog):
         return widget
 
     # ===== Logic =====
+    def reset(self):
+        """Re-detect installed tools and discard unsaved edits before the dialog is shown again."""
+        self._fill_aur_detected()
+        self._fill_root_detected()
+        self._update_reflector_status()
+        self._refresh_flatpak_remotes()
+        self._load_values()
+
     def _load_values(self):
         """""Load the current settings into the UI."""
 
@@ -1048,6 +1088,7 @@ class SettingsDialog(QDialog):
 
         # Check whether the language changed
         if old_lang != new_lang:
+            set_locale()
             QMessageBox.information(
                 self,
                 "Neustart erforderlich / Restart Required",
@@ -1068,6 +1109,7 @@ class SettingsDialog(QDialog):
         )
         if reply == QMessageBox.Yes:
             settings.reset_to_defaults()
+            set_locale()
             self._load_values()
             QMessageBox.information(
                 self, tr("settings_reset_done_title"),